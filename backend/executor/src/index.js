@@ -1,13 +1,19 @@
 const express = require('express');
 const bodyParser = require('body-parser');
-const { spawn } = require('child_process');
+const { spawn, spawnSync } = require('child_process');
 const fs = require('fs');
+const fsp = fs.promises;
 const path = require('path');
+const crypto = require('crypto');
+const os = require('os');
 
 const app = express();
 const PORT = 3000;
 
-app.use(bodyParser.json());
+// Test inputs routinely exceed body-parser's 100kb default. The backend reads the same
+// EXECUTOR_MAX_BODY_BYTES to reject larger payloads before sending them.
+const MAX_BODY_BYTES = parseInt(process.env.EXECUTOR_MAX_BODY_BYTES || '', 10) || 10 * 1024 * 1024;
+app.use(bodyParser.json({ limit: MAX_BODY_BYTES }));
 
 // Temp directory for executions
 const TEMP_DIR = '/tmp/executions';
@@ -15,6 +21,238 @@ if (!fs.existsSync(TEMP_DIR)) {
     fs.mkdirSync(TEMP_DIR, { recursive: true });
 }
 
+// Per-language settings, resolved once at startup instead of on every request.
+// Unknown languages fall back to the Python profile (historical behaviour).
+const JAVA_STARTUP_OFFSET = process.env.JAVA_STARTUP_OFFSET ? parseFloat(process.env.JAVA_STARTUP_OFFSET) : 1.0;
+const LANGUAGE_PROFILES = {
+    java: {
+        fileName: 'Main.java',
+        defaultTimeLimit: 3.0, // Java needs more time for JVM startup
+        startupOffset: JAVA_STARTUP_OFFSET,
+        startupOffsetMs: Math.ceil(JAVA_STARTUP_OFFSET * 1000),
+        compileCmd: 'javac',
+        compileArgs: ['Main.java'],
+        checkCmd: 'javac',
+        checkArgs: ['Main.java'],
+        cacheable: true, // Compiled classes go through the compile cache
+        runCmd: 'java',
+        runArgs: ['Main']
+    },
+    python: {
+        fileName: 'main.py',
+        defaultTimeLimit: 2.0,
+        startupOffset: 0,
+        startupOffsetMs: 0,
+        compileCmd: null, // Interpreted, only compiled by /check
+        checkCmd: 'python3',
+        checkArgs: ['-m', 'py_compile', 'main.py'],
+        cacheable: false,
+        runCmd: null, // Uses cmd/args from the request
+        runArgs: null
+    }
+};
+
+// Per-run trace logs (compile/start/finish) are only emitted with EXECUTOR_DEBUG=true;
+// under load they are several synchronous stdout writes per test case.
+const DEBUG_LOGS = process.env.EXECUTOR_DEBUG === 'true';
+
+function debugLog(message) {
+    if (DEBUG_LOGS) console.log(message);
+}
+
+function getLanguageProfile(language) {
+    return LANGUAGE_PROFILES[language] || LANGUAGE_PROFILES.python;
+}
+
+// Hard cap on captured output per stream. A runaway print loop is killed as soon as it
+// crosses the cap instead of running until the time limit while buffering everything.
+// Invalid values fall back to 8 MB: NaN would disable the cap and 0 would kill any program that prints.
+const configuredOutputLimitKb = parseInt(process.env.OUTPUT_LIMIT_KB || '', 10);
+const OUTPUT_LIMIT_KB = configuredOutputLimitKb >= 1 ? configuredOutputLimitKb : 8192;
+if (process.env.OUTPUT_LIMIT_KB && configuredOutputLimitKb !== OUTPUT_LIMIT_KB) {
+    console.warn(`[Executor] Invalid OUTPUT_LIMIT_KB "${process.env.OUTPUT_LIMIT_KB}", using ${OUTPUT_LIMIT_KB}`);
+}
+const OUTPUT_LIMIT_BYTES = OUTPUT_LIMIT_KB * 1024;
+
+// Upper bound on concurrently compiling/running programs in this container, whatever the number
+// of backend instances sending work. Extra requests wait in FIFO order instead of oversubscribing
+// the CPU, which would distort measured run times.
+// Unset or invalid values (NaN, 0, negative) fall back to the CPU count: a limit below 1 would
+// make every request wait forever.
+const configuredMaxRuns = parseInt(process.env.MAX_CONCURRENT_RUNS || '', 10);
+const MAX_CONCURRENT_RUNS = configuredMaxRuns >= 1 ? configuredMaxRuns : Math.max(1, os.cpus().length);
+if (process.env.MAX_CONCURRENT_RUNS && configuredMaxRuns !== MAX_CONCURRENT_RUNS) {
+    console.warn(`[Executor] Invalid MAX_CONCURRENT_RUNS "${process.env.MAX_CONCURRENT_RUNS}", using ${MAX_CONCURRENT_RUNS}`);
+}
+// Longest a request waits for a run slot before it is turned away with 503. The backend reads the
+// same EXECUTOR_MAX_QUEUE_WAIT_MS to add it to its request timeout and retries 503s, so time spent
+// queueing is never mistaken for the program's run time.
+const configuredQueueWait = parseInt(process.env.EXECUTOR_MAX_QUEUE_WAIT_MS || '', 10);
+const MAX_QUEUE_WAIT_MS = configuredQueueWait >= 0 ? configuredQueueWait : 10000;
+if (process.env.EXECUTOR_MAX_QUEUE_WAIT_MS && configuredQueueWait !== MAX_QUEUE_WAIT_MS) {
+    console.warn(`[Executor] Invalid EXECUTOR_MAX_QUEUE_WAIT_MS "${process.env.EXECUTOR_MAX_QUEUE_WAIT_MS}", using ${MAX_QUEUE_WAIT_MS}`);
+}
+let activeRuns = 0;
+const runQueue = [];
+
+// Resolves to true once a slot is taken, or to false when none freed up within MAX_QUEUE_WAIT_MS
+function acquireRunSlot() {
+    if (activeRuns < MAX_CONCURRENT_RUNS) {
+        activeRuns++;
+        return Promise.resolve(true);
+    }
+    return new Promise(resolve => {
+        const waiter = () => {
+            clearTimeout(timer);
+            resolve(true);
+        };
+        const timer = setTimeout(() => {
+            const index = runQueue.indexOf(waiter);
+            if (index !== -1) runQueue.splice(index, 1);
+            resolve(false);
+        }, MAX_QUEUE_WAIT_MS);
+        runQueue.push(waiter);
+    });
+}
+
+function releaseRunSlot() {
+    const next = runQueue.shift();
+    if (next) next();
+    else activeRuns--;
+}
+
+// Holds a run slot until the response is sent or the client goes away. Resolves to false when no
+// slot is held: either the queue wait ran out (a 503 has been sent) or the client disconnected while
+// waiting (its 'close' event has fired by then and would never release the slot).
+async function holdRunSlot(res) {
+    let closedWhileWaiting = false;
+    const onCloseWhileWaiting = () => { closedWhileWaiting = true; };
+    res.once('close', onCloseWhileWaiting);
+    const acquired = await acquireRunSlot();
+    res.removeListener('close', onCloseWhileWaiting);
+
+    if (!acquired) {
+        if (!closedWhileWaiting) {
+            res.status(503).json({ error: 'Executor busy', busy: true });
+        }
+        return false;
+    }
+
+    let released = false;
+    const release = () => {
+        if (released) return;
+        released = true;
+        releaseRunSlot();
+    };
+    if (closedWhileWaiting || res.destroyed || res.writableEnded) {
+        release();
+        return false;
+    }
+    res.once('finish', release);
+    res.once('close', release);
+    return true;
+}
+
+// Kills a compiler or program when the client disconnects before it exits. The slot is released on
+// 'close', so a process left running would escape MAX_CONCURRENT_RUNS.
+function killOnDisconnect(res, child) {
+    const kill = () => {
+        if (child.exitCode === null && child.signalCode === null) child.kill('SIGKILL');
+    };
+    res.once('close', kill);
+    child.once('close', () => res.removeListener('close', kill));
+}
+
+// Environment for child processes; process.env does not change at runtime
+const CHILD_ENV = { ...process.env, PYTHONUNBUFFERED: "1" }; // Ensure unbuffered output
+
+// Content-addressed cache of compiled classes, keyed by the SHA-256 of the compiler version and source.
+// Lives outside TEMP_DIR so per-run cleanup never destroys reusable binaries.
+// Set COMPILE_CACHE=off to disable.
+const COMPILE_CACHE_ENABLED = process.env.COMPILE_CACHE !== 'off';
+const COMPILE_CACHE_DIR = process.env.COMPILE_CACHE_DIR || '/tmp/compile-cache';
+const COMPILE_CACHE_TTL_MS = 24 * 60 * 60 * 1000; // Evict entries unused for 24 hours
+if (COMPILE_CACHE_ENABLED && !fs.existsSync(COMPILE_CACHE_DIR)) {
+    fs.mkdirSync(COMPILE_CACHE_DIR, { recursive: true });
+}
+
+// The compiler version is part of the cache key: the cache directory is a persistent volume, and
+// classes built by a previous image's JDK must not be reused after an upgrade. Read once at startup
+// (javac 8 prints it on stderr, later versions on stdout); images without javac never use the cache.
+const COMPILER_VERSION = (() => {
+    if (!COMPILE_CACHE_ENABLED) return '';
+    const result = spawnSync('javac', ['-version'], { encoding: 'utf8' });
+    return result.error ? '' : `${result.stdout}${result.stderr}`.trim();
+})();
+
+function getCompileCacheDir(code) {
+    const hash = crypto.createHash('sha256').update(COMPILER_VERSION).update('\0').update(code).digest('hex');
+    return path.join(COMPILE_CACHE_DIR, hash);
+}
+
+async function pathExists(target) {
+    try {
+        await fsp.access(target);
+        return true;
+    } catch (e) {
+        return false;
+    }
+}
+
+// Copies cached .class files into workDir. Returns false on cache miss.
+async function restoreCompiledClasses(cacheDir, workDir) {
+    if (!COMPILE_CACHE_ENABLED || !cacheDir) return false;
+    try {
+        const files = await fsp.readdir(cacheDir);
+        await Promise.all(files.map(file => fsp.copyFile(path.join(cacheDir, file), path.join(workDir, file))));
+        const now = new Date();
+        await fsp.utimes(cacheDir, now, now); // Mark as recently used
+        return true;
+    } catch (e) {
+        if (e.code !== 'ENOENT') {
+            console.error('[Executor] Failed to restore compiled classes from cache', e);
+        }
+        return false;
+    }
+}
+
+// Stores freshly compiled .class files. Written to a staging dir and renamed so
+// concurrent runs never observe a partially populated entry.
+async function storeCompiledClasses(cacheDir, workDir) {
+    if (!COMPILE_CACHE_ENABLED || await pathExists(cacheDir)) return;
+    const stagingDir = `${cacheDir}.${process.pid}.${Date.now()}`;
+    try {
+        await fsp.mkdir(stagingDir, { recursive: true });
+        const classFiles = (await fsp.readdir(workDir)).filter(file => file.endsWith('.class'));
+        await Promise.all(classFiles.map(file => fsp.copyFile(path.join(workDir, file), path.join(stagingDir, file))));
+        await fsp.rename(stagingDir, cacheDir);
+    } catch (e) {
+        // Another run may have stored the same entry first (EEXIST/ENOTEMPTY)
+        await fsp.rm(stagingDir, { recursive: true, force: true }).catch(() => {});
+    }
+}
+
+// Compiler errors for sources that failed to compile, keyed like the compile cache. A submission
+// that does not compile is otherwise recompiled once per test case only to fail the same way.
+// Kept in memory (bounded, oldest evicted first): only the compiler's verdict is stored.
+const FAILED_COMPILE_CACHE_SIZE = 256;
+// javac's "<file>:<line>: error:" lines; only Java sources go through the compile cache
+const COMPILER_DIAGNOSTIC_PATTERN = /^Main\.java:\d+: error:/m;
+const failedCompiles = new Map();
+
+function getCachedCompileError(cacheDir) {
+    if (!COMPILE_CACHE_ENABLED || !cacheDir) return undefined;
+    return failedCompiles.get(cacheDir);
+}
+
+function storeCompileError(cacheDir, stderr) {
+    if (!COMPILE_CACHE_ENABLED || !cacheDir) return;
+    if (failedCompiles.size >= FAILED_COMPILE_CACHE_SIZE) {
+        failedCompiles.delete(failedCompiles.keys().next().value);
+    }
+    failedCompiles.set(cacheDir, stderr);
+}
+
 // Periodic cleanup of temp files older than 10 minutes
 // Folders should normally be deleted after execution, but this is a safety net.
 setInterval(() => {
@@ -36,8 +274,117 @@ setInterval(() => {
     } catch (e) {
         console.error('[Executor] Periodic cleanup error', e);
     }
+
+    if (!COMPILE_CACHE_ENABLED) return;
+    try {
+        const now = Date.now();
+        fs.readdirSync(COMPILE_CACHE_DIR).forEach(entry => {
+            const entryPath = path.join(COMPILE_CACHE_DIR, entry);
+            try {
+                if (now - fs.statSync(entryPath).mtimeMs > COMPILE_CACHE_TTL_MS) {
+                    fs.rmSync(entryPath, { recursive: true, force: true });
+                }
+            } catch (err) {
+                // Entry might have been evicted concurrently
+            }
+        });
+    } catch (e) {
+        console.error('[Executor] Compile cache cleanup error', e);
+    }
 }, 300000); // Run every 5 minutes
 
+// Runs a compiler command in workDir. Rejects with the compiler's stderr on failure.
+// When cacheDir is given, a compiler error (not a timeout or spawn failure) is remembered for that source.
+// The compiler is killed if the client behind res disconnects first.
+function compile(compileCmd, compileArgs, workDir, runId, cacheDir, res) {
+    return new Promise((resolve, reject) => {
+        debugLog(`[Executor] Starting compilation: ${compileCmd} ${compileArgs.join(' ')} (runId: ${runId})`);
+        const compiler = spawn(compileCmd, compileArgs, { cwd: workDir });
+        killOnDisconnect(res, compiler);
+        const compileStderrChunks = [];
+        // Timeout, spawn error and close can each fire; only the first one settles the compilation
+        let settled = false;
+
+        const compileTimer = setTimeout(() => {
+            if (settled) return;
+            settled = true;
+            compiler.kill('SIGKILL');
+            reject('Compilation timeout (60s)');
+        }, 60000);
+
+        compiler.on('error', (err) => {
+            clearTimeout(compileTimer);
+            if (settled) return;
+            settled = true;
+            reject(`Failed to start ${compileCmd}: ${err.message}`);
+        });
+
+        compiler.stderr.on('data', (data) => compileStderrChunks.push(data));
+        compiler.on('close', (code, signal) => {
+            clearTimeout(compileTimer);
+            debugLog(`[Executor] Compilation finished with code ${code} (runId: ${runId})`);
+            if (settled) return;
+            settled = true;
+            if (code === 0) {
+                resolve();
+                return;
+            }
+            const stderr = Buffer.concat(compileStderrChunks).toString();
+            // Only a compiler that exited on its own with a diagnostic about the source is a verdict on it.
+            // A kill (signal, null code) or a JVM failure (VM init error, OutOfMemoryError under the
+            // container limit) reflects load or the environment and must not be remembered.
+            if (signal === null && code > 0 && COMPILER_DIAGNOSTIC_PATTERN.test(stderr)) {
+                storeCompileError(cacheDir, stderr);
+            }
+            reject(stderr || 'Compilation failed');
+        });
+    });
+}
+
+// Syntax-only validation: compiles the source without running it.
+// Much cheaper than /run for callers that only need to know whether code compiles.
+app.post('/check', async (req, res) => {
+    const { code, language } = req.body;
+
+    if (!code || !language) {
+        return res.status(400).json({ error: 'Missing code or language' });
+    }
+
+    const runId = Date.now().toString() + Math.random().toString(36).substring(7);
+    const workDir = path.join(TEMP_DIR, runId);
+
+    if (!(await holdRunSlot(res))) return;
+
+    try {
+        const profile = getLanguageProfile(language);
+        await fsp.mkdir(workDir, { recursive: true });
+        await fsp.writeFile(path.join(workDir, profile.fileName), code);
+
+        const compileCacheDir = profile.cacheable ? getCompileCacheDir(code) : null;
+        if (compileCacheDir && COMPILE_CACHE_ENABLED && await pathExists(compileCacheDir)) {
+            return res.json({ success: true, stderr: '' });
+        }
+        const cachedError = getCachedCompileError(compileCacheDir);
+        if (cachedError !== undefined) {
+            return res.json({ success: false, stderr: cachedError || 'Compilation failed' });
+        }
+
+        try {
+            await compile(profile.checkCmd, profile.checkArgs, workDir, runId, compileCacheDir, res);
+            if (compileCacheDir) await storeCompiledClasses(compileCacheDir, workDir);
+        } catch (err) {
+            return res.json({ success: false, stderr: err || 'Compilation failed' });
+        }
+
+        res.json({ success: true, stderr: '' });
+    } catch (e) {
+        console.error(e);
+        res.status(500).json({ error: e.message });
+    } finally {
+        fsp.rm(workDir, { recursive: true, force: true }).catch(e => console.error('Cleanup failed', e));
+    }
+});
+
 app.post('/run', async (req, res) => {
     try {
         const { code, language, stdin, cmd, args } = req.body;
@@ -46,57 +393,32 @@ app.post('/run', async (req, res) => {
             return res.status(400).json({ error: 'Missing code or language' });
         }
 
+        if (!(await holdRunSlot(res))) return;
+
         const runId = Date.now().toString() + Math.random().toString(36).substring(7);
         const workDir = path.join(TEMP_DIR, runId);
-        fs.mkdirSync(workDir, { recursive: true });
-
-        const fileName = language === 'java' ? 'Main.java' : 'main.py';
-        const filePath = path.join(workDir, fileName);
+        await fsp.mkdir(workDir, { recursive: true });
 
-        fs.writeFileSync(filePath, code);
+        const profile = getLanguageProfile(language);
+        const filePath = path.join(workDir, profile.fileName);
 
-        if (stdin) {
-            fs.writeFileSync(path.join(workDir, 'stdin.txt'), stdin);
-        }
+        await fsp.writeFile(filePath, code);
 
         // Determine command
         let spawnCmd = cmd;
         let spawnArgs = args || [];
 
-        // Java needs more time for JVM startup
-        const defaultTimeLimit = language === 'java' ? 3.0 : 2.0;
-        const timeLimit = req.body.cpuTimeLimit || defaultTimeLimit;
+        const timeLimit = req.body.cpuTimeLimit || profile.defaultTimeLimit;
         const timeoutMs = Math.ceil(timeLimit * 1000);
+        const absoluteTimeoutMs = timeoutMs + profile.startupOffsetMs;
 
-        const javaStartupOffset = process.env.JAVA_STARTUP_OFFSET ? parseFloat(process.env.JAVA_STARTUP_OFFSET) : 1.0;
-        const absoluteTimeoutMs = language === 'java' ? timeoutMs + Math.ceil(javaStartupOffset * 1000) : timeoutMs;
-
-        // Compilation for Java
-        if (language === 'java') {
+        // Compilation (skipped when the same source was compiled, or failed to compile, before)
+        const compileCacheDir = profile.cacheable ? getCompileCacheDir(code) : null;
+        if (profile.compileCmd && !(await restoreCompiledClasses(compileCacheDir, workDir))) {
             try {
-                await new Promise((resolve, reject) => {
-                    console.log(`[Executor] Starting compilation: javac Main.java (runId: ${runId})`);
-                    const compile = spawn('javac', ['Main.java'], { cwd: workDir });
-                    let compileStderr = '';
-
-                    const compileTimer = setTimeout(() => {
-                        compile.kill('SIGKILL');
-                        reject('Compilation timeout (60s)');
-                    }, 60000);
-
-                    compile.on('error', (err) => {
-                        clearTimeout(compileTimer);
-                        reject(`Failed to start javac: ${err.message}`);
-                    });
-
-                    compile.stderr.on('data', (data) => compileStderr += data.toString());
-                    compile.on('close', (code) => {
-                        clearTimeout(compileTimer);
-                        console.log(`[Executor] Compilation finished with code ${code} (runId: ${runId})`);
-                        if (code !== 0) reject(compileStderr);
-                        else resolve();
-                    });
-                });
+                const cachedError = getCachedCompileError(compileCacheDir);
+                if (cachedError !== undefined) throw cachedError;
+                await compile(profile.compileCmd, profile.compileArgs, workDir, runId, compileCacheDir, res);
             } catch (err) {
                 return res.json({
                     stdout: '',
@@ -106,55 +428,89 @@ app.post('/run', async (req, res) => {
                     memory: 0
                 }); // Return as result, not 500
             }
-            spawnCmd = 'java';
-            spawnArgs = ['Main'];
+            await storeCompiledClasses(compileCacheDir, workDir);
+        }
+
+        if (profile.runCmd) {
+            spawnCmd = profile.runCmd;
+            spawnArgs = profile.runArgs;
         }
 
         const startTime = process.hrtime();
 
         const child = spawn(spawnCmd, spawnArgs, {
             cwd: workDir,
-            env: { ...process.env, PYTHONUNBUFFERED: "1" } // Ensure unbuffered output
+            env: CHILD_ENV
         });
+        killOnDisconnect(res, child);
 
-        console.log(`[Executor] Started execution: ${spawnCmd} ${spawnArgs.join(' ')} (runId: ${runId})`);
+        debugLog(`[Executor] Started execution: ${spawnCmd} ${spawnArgs.join(' ')} (runId: ${runId})`);
 
-        let stdout = '';
-        let stderr = '';
+        // Raw chunks are decoded once on close: no per-chunk string copies, and multi-byte
+        // UTF-8 characters split across chunk boundaries are not mangled
+        const stdoutChunks = [];
+        const stderrChunks = [];
+        let stderrNotes = ''; // Executor-appended verdict markers
         let peakMemoryKb = 0;
 
-        // Memory polling (Linux peak RSS via /proc)
+        // Memory polling (Linux peak RSS via /proc). Reads are async so concurrent runs
+        // do not stall the event loop; a tick is skipped while the previous read is in flight.
+        let memoryReadPending = false;
         const memoryInterval = setInterval(() => {
-            if (child.pid) {
-                try {
-                    const statusContent = fs.readFileSync(`/proc/${child.pid}/status`, 'utf8');
+            if (!child.pid || memoryReadPending) return;
+            memoryReadPending = true;
+            fsp.readFile(`/proc/${child.pid}/status`, 'utf8')
+                .then((statusContent) => {
                     const match = statusContent.match(/VmHWM:\s+(\d+)\s+kB/);
                     if (match) {
                         const currentPeak = parseInt(match[1], 10);
                         if (currentPeak > peakMemoryKb) peakMemoryKb = currentPeak;
                     }
-                } catch (e) {
+                })
+                .catch(() => {
                     // Process likely finished
-                }
-            }
+                })
+                .finally(() => {
+                    memoryReadPending = false;
+                });
         }, 50);
 
-        // Handle stdin
-        if (stdin) {
-            child.stdin.write(stdin);
-            child.stdin.end();
-        } else {
-            // Important: Close stdin if no input to avoid hangs on input()
-            child.stdin.end();
-        }
-
-        child.stdout.on('data', (data) => stdout += data.toString());
-        child.stderr.on('data', (data) => stderr += data.toString());
+        // Handle stdin: piped straight to the child, never staged on disk. Closing it
+        // without input is important to avoid hangs on input(). A program that exits
+        // before reading all of a large input closes the pipe (EPIPE); that is its verdict,
+        // not a server error.
+        child.stdin.on('error', () => {});
+        child.stdin.end(stdin || undefined);
+
+        let stdoutBytes = 0;
+        let stderrBytes = 0;
+        let outputLimitExceeded = false;
+        const killOnOutputLimit = () => {
+            if (outputLimitExceeded) return;
+            outputLimitExceeded = true;
+            child.kill('SIGKILL');
+            stderrNotes += '\nOutput Limit Exceeded';
+        };
+
+        child.stdout.on('data', (data) => {
+            if (outputLimitExceeded) return;
+            stdoutBytes += data.length;
+            if (stdoutBytes > OUTPUT_LIMIT_BYTES) return killOnOutputLimit();
+            stdoutChunks.push(data);
+        });
+        child.stderr.on('data', (data) => {
+            if (outputLimitExceeded) return;
+            stderrBytes += data.length;
+            if (stderrBytes > OUTPUT_LIMIT_BYTES) return killOnOutputLimit();
+            stderrChunks.push(data);
+        });
 
         // Timeout handling
+        let timedOut = false;
         const timer = setTimeout(() => {
+            timedOut = true;
             child.kill('SIGKILL');
-            stderr += '\nTime Limit Exceeded';
+            stderrNotes += '\nTime Limit Exceeded';
         }, absoluteTimeoutMs);
 
         child.on('close', (code) => {
@@ -164,24 +520,23 @@ app.post('/run', async (req, res) => {
             const [seconds, nanoseconds] = process.hrtime(startTime);
             let timeInSeconds = seconds + nanoseconds / 1e9;
 
-            // Subtract startup offset for Java to be fair
-            if (language === 'java') {
-                timeInSeconds = Math.max(0, timeInSeconds - javaStartupOffset);
+            // Subtract startup offset (JVM) to be fair
+            if (profile.startupOffset) {
+                timeInSeconds = Math.max(0, timeInSeconds - profile.startupOffset);
             }
 
             // Cleanup
-            try {
-                fs.rmSync(workDir, { recursive: true, force: true });
-            } catch (e) {
-                console.error('Cleanup failed', e);
-            }
+            fsp.rm(workDir, { recursive: true, force: true }).catch(e => console.error('Cleanup failed', e));
 
             res.json({
-                stdout,
-                stderr,
+                stdout: Buffer.concat(stdoutChunks).toString(),
+                stderr: Buffer.concat(stderrChunks).toString() + stderrNotes,
                 exitCode: code,
                 time: timeInSeconds,
-                memory: peakMemoryKb
+                memory: peakMemoryKb,
+                // Structured verdict hints so callers do not have to scan stderr
+                timedOut,
+                outputLimitExceeded
             });
         });
 
@@ -196,6 +551,12 @@ app.post('/run', async (req, res) => {
     }
 });
 
-app.listen(PORT, () => {
+const server = app.listen(PORT, () => {
     console.log(`Executor listening on port ${PORT}`);
 });
+
+// The backend keeps connections to the executor alive between test cases. Node's 5s default
+// would close idle sockets under it and the next reuse fails with ECONNRESET, so idle
+// connections are kept past the backend's own 60s idle timeout (headersTimeout must exceed it).
+server.keepAliveTimeout = 65000;
+server.headersTimeout = 66000;
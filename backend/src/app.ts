@@ -34,6 +34,7 @@ import createGradeController from './controllers/grade.controller';
 import createConfigController from './controllers/config.controller';
 
 import { SubmissionService } from './services/SubmissionService';
+import { SandboxFusionService } from './services/SandboxFusionService';
 
 // Use Cases
 import {
@@ -220,7 +221,8 @@ export function createApp(): Application {
     res.json({
       status: 'ok',
       timestamp: new Date().toISOString(),
-      uptime: process.uptime()
+      uptime: process.uptime(),
+      executors: container.resolve(SandboxFusionService).getExecutorLatencyStats()
     });
   });
 
@@ -27,6 +27,7 @@ import { AllowedIPRepository } from '../repositories/AllowedIPRepository';
 
 import { EmailService } from '../services/EmailService';
 import { Judge0Service } from '../services/Judge0Service';
+import { SandboxFusionService } from '../services/SandboxFusionService';
 import { PasswordResetService } from '../services/PasswordResetService';
 import { RefreshTokenService } from '../services/RefreshTokenService';
 import { InviteService } from '../services/InviteService';
@@ -156,6 +157,8 @@ export function setupContainer(): void {
 
   container.registerSingleton(EmailService);
   container.registerSingleton(Judge0Service);
+  // Shared so every consumer sees the same results map and per-language concurrency limits
+  container.registerSingleton(SandboxFusionService);
   container.registerSingleton(PasswordResetService);
   container.registerSingleton(RefreshTokenService);
   container.registerSingleton(InviteService);
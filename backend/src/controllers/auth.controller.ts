@@ -104,16 +104,19 @@ function createAuthController(
     '/refresh',
     authRateLimiter,
     (req, _res, next) => {
-
-      logger.debug('[REFRESH] Request received (before validation)', {
-        bodyKeys: Object.keys(req.body || {}),
-        refreshTokenType: typeof req.body?.refreshToken,
-        refreshTokenLength: req.body?.refreshToken?.length,
-        refreshTokenValue: req.body?.refreshToken ? `${req.body.refreshToken.substring(0, 30)}...` : 'undefined',
-        fullBody: JSON.stringify(req.body).substring(0, 300),
-        contentType: req.headers['content-type'],
-        rawBody: typeof req.body === 'object' ? JSON.stringify(req.body) : String(req.body)
-      });
+      if (logger.isDebugEnabled()) {
+        const serializedBody = typeof req.body === 'object' ? JSON.stringify(req.body) : String(req.body);
+
+        logger.debug('[REFRESH] Request received (before validation)', {
+          bodyKeys: Object.keys(req.body || {}),
+          refreshTokenType: typeof req.body?.refreshToken,
+          refreshTokenLength: req.body?.refreshToken?.length,
+          refreshTokenValue: req.body?.refreshToken ? `${req.body.refreshToken.substring(0, 30)}...` : 'undefined',
+          fullBody: serializedBody.substring(0, 300),
+          contentType: req.headers['content-type'],
+          rawBody: serializedBody
+        });
+      }
       next();
     },
     validateBody(RefreshTokenDTO),
@@ -73,10 +73,18 @@ function createQuestionController(
     '/',
     authenticate,
     requireTeacher,
-    asyncHandler(async (_req: AuthRequest, res: Response): Promise<void> => {
-      const questions = await getAllQuestionsUseCase.execute();
+    asyncHandler(async (req: AuthRequest, res: Response): Promise<void> => {
+      const tags = req.query.tags ? (req.query.tags as string).split(',').filter(Boolean) : undefined;
+
+      const result = await getAllQuestionsUseCase.execute({
+        source: req.query.source as string | undefined,
+        tags,
+        page: req.query.page ? parseInt(req.query.page as string) || 1 : undefined,
+        limit: req.query.limit ? parseInt(req.query.limit as string) || 20 : undefined,
+        summary: req.query.fields === 'summary'
+      });
 
-      successResponse(res, { questions }, 'List of questions');
+      successResponse(res, result, 'List of questions');
     })
   );
 
@@ -96,6 +104,8 @@ function createQuestionController(
 
       const result = await searchQuestionsUseCase.execute({
         searchTerm: searchTerm.trim(),
+        source: req.query.source as string | undefined,
+        tags: req.query.tags ? (req.query.tags as string).split(',').filter(Boolean) : undefined,
         page,
         limit
       });
@@ -95,7 +95,7 @@ function createQuestionListController(
         questionListId: req.params.id,
         bodyKeys: Object.keys(req.body || {}),
         contentType: req.headers['content-type'],
-        rawBody: JSON.stringify(req.body),
+        rawBody: req.body,
         title: req.body?.title,
         description: req.body?.description,
         startDate: req.body?.startDate,
@@ -191,7 +191,7 @@ function createQuestionListController(
         questionListId: req.params.id,
         bodyKeys: Object.keys(req.body || {}),
         questionId: req.body?.questionId,
-        fullBody: JSON.stringify(req.body),
+        fullBody: req.body,
         userId: req.user?.sub
       });
       next();
@@ -75,7 +75,12 @@ export class SubmissionCode {
    */
   getLineCount(): number {
     if (!this.value) return 0;
-    return this.value.split('\n').length;
+    // Counts separators instead of materializing every line
+    let count = 1;
+    for (let index = this.value.indexOf('\n'); index !== -1; index = this.value.indexOf('\n', index + 1)) {
+      count++;
+    }
+    return count;
   }
 
   /**
@@ -138,7 +143,8 @@ export class SubmissionCode {
    * Returns a preview of the code (first lines)
    */
   getPreview(lines: number = 5): string {
-    const codeLines = this.value.split('\n');
+    // Split limit stops scanning after the first lines + 1 entries (one extra to detect truncation)
+    const codeLines = this.value.split('\n', lines + 1);
     const preview = codeLines.slice(0, lines).join('\n');
     
     if (codeLines.length > lines) {
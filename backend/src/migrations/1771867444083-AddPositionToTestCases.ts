@@ -0,0 +1,32 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+export class AddPositionToTestCases1771867444083 implements MigrationInterface {
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(
+            `ALTER TABLE "test_cases" ADD "position" SERIAL NOT NULL`
+        );
+        // Existing rows keep their creation order
+        await queryRunner.query(
+            `UPDATE "test_cases" AS tc SET "position" = ordered.rn
+             FROM (SELECT "id", ROW_NUMBER() OVER (ORDER BY "created_at", "id") AS rn FROM "test_cases") AS ordered
+             WHERE tc."id" = ordered."id"`
+        );
+        await queryRunner.query(
+            `SELECT setval(pg_get_serial_sequence('test_cases', 'position'), COALESCE((SELECT MAX("position") FROM "test_cases"), 0) + 1, false)`
+        );
+        await queryRunner.query(
+            `CREATE INDEX "idx_test_cases_question_position" ON "test_cases" ("question_id", "position")`
+        );
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(
+            `DROP INDEX "idx_test_cases_question_position"`
+        );
+        await queryRunner.query(
+            `ALTER TABLE "test_cases" DROP COLUMN "position"`
+        );
+    }
+
+}
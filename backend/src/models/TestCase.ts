@@ -1,4 +1,4 @@
-import { Entity, PrimaryGeneratedColumn, Column, ManyToOne, JoinColumn, CreateDateColumn } from 'typeorm';
+import { Entity, PrimaryGeneratedColumn, Column, ManyToOne, JoinColumn, CreateDateColumn, Generated } from 'typeorm';
 import { Question } from './Question';
 
 @Entity('test_cases')
@@ -21,6 +21,11 @@ export class TestCase {
   @Column({ name: 'is_hidden', type: 'boolean', default: false })
   isHidden!: boolean;
 
+  // Assigned by a database sequence in insertion order; test cases are listed and judged in this order
+  @Column({ type: 'int' })
+  @Generated('increment')
+  position!: number;
+
   @CreateDateColumn({ name: 'created_at', type: 'timestamp with time zone' })
   createdAt!: Date;
 
@@ -1,7 +1,22 @@
 import { injectable } from 'tsyringe';
+import { Brackets, SelectQueryBuilder } from 'typeorm';
 import { BaseRepository } from './BaseRepository';
 import { Question } from '../models/Question';
 
+/**
+ * Columns needed to list/pick questions; heavy text columns (statement, oracle, checker) are left out
+ */
+const QUESTION_SUMMARY_COLUMNS = [
+  'question.id',
+  'question.title',
+  'question.source',
+  'question.tags',
+  'question.timeLimitMs',
+  'question.memoryLimitKb',
+  'question.createdAt',
+  'question.updatedAt'
+];
+
 @injectable()
 export class QuestionRepository extends BaseRepository<Question> {
   constructor() {
@@ -16,13 +31,6 @@ export class QuestionRepository extends BaseRepository<Question> {
     });
   }
 
-  async findById(id: string): Promise<Question | null> {
-    return this.repository.findOne({
-      where: { id },
-      relations: ['testCases']
-    });
-  }
-  
   async findWithTestCases(id: string): Promise<Question | null> {
     return this.repository.findOne({
       where: { id },
@@ -37,15 +45,53 @@ export class QuestionRepository extends BaseRepository<Question> {
       .getMany();
   }
 
+  /**
+   * Lists questions filtered by source/tags, pushing filters and pagination into SQL
+   * so only the requested page is loaded. Without page/limit, all matches are returned.
+   */
+  async findByFilters(filters: {
+    source?: string;
+    tags?: string[];
+    page?: number;
+    limit?: number;
+    summary?: boolean;
+  }): Promise<{ questions: Question[]; total: number }> {
+    const queryBuilder = this.repository.createQueryBuilder('question');
+
+    if (filters.summary) {
+      queryBuilder.select(QUESTION_SUMMARY_COLUMNS);
+    }
+
+    this.applyMetadataFilters(queryBuilder, filters);
+
+    queryBuilder.orderBy('question.createdAt', 'DESC');
+
+    if (filters.limit !== undefined) {
+      const page = filters.page || 1;
+      queryBuilder.skip((page - 1) * filters.limit).take(filters.limit);
+    }
+
+    const [questions, total] = await queryBuilder.getManyAndCount();
+
+    return { questions, total };
+  }
+
   async searchGlobal(
     searchTerm: string,
     skip?: number,
-    take?: number
+    take?: number,
+    filters: { source?: string; tags?: string[] } = {}
   ): Promise<[Question[], number]> {
+    // ILIKE matches case-insensitively in one pass, without lowering every row first
     const query = this.repository.createQueryBuilder('question')
-      .where('LOWER(question.title) LIKE LOWER(:searchTerm)', { searchTerm: `%${searchTerm}%` })
-      .orWhere('LOWER(question.source) LIKE LOWER(:searchTerm)', { searchTerm: `%${searchTerm}%` })
-      .orWhere('question.tags IS NOT NULL AND LOWER(question.tags::text) LIKE LOWER(:tagsSearch)', { tagsSearch: `%${searchTerm}%` });
+      .where(new Brackets(qb => {
+        qb.where('question.title ILIKE :searchTerm', { searchTerm: `%${searchTerm}%` })
+          .orWhere('question.source ILIKE :searchTerm')
+          .orWhere('question.tags IS NOT NULL AND question.tags::text ILIKE :searchTerm');
+      }));
+
+    // Metadata filters are ANDed in the same query, so the database discards non-matching rows
+    this.applyMetadataFilters(query, filters);
 
     query.orderBy('question.createdAt', 'DESC');
 
@@ -54,5 +100,21 @@ export class QuestionRepository extends BaseRepository<Question> {
 
     return query.getManyAndCount();
   }
+
+  private applyMetadataFilters(
+    queryBuilder: SelectQueryBuilder<Question>,
+    filters: { source?: string; tags?: string[] }
+  ): void {
+    if (filters.source) {
+      queryBuilder.andWhere('question.source = :source', { source: filters.source });
+    }
+
+    if (filters.tags && filters.tags.length > 0) {
+      queryBuilder.andWhere(
+        'EXISTS (SELECT 1 FROM jsonb_array_elements_text(question.tags) AS tag WHERE tag = ANY(:tags))',
+        { tags: filters.tags }
+      );
+    }
+  }
 }
 
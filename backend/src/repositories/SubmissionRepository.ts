@@ -33,6 +33,31 @@ export class SubmissionRepository extends BaseRepository<Submission> {
     });
   }
 
+  /**
+   * Best score of a user per question, for several questions in a single aggregate query.
+   * Returns raw rows, so no Submission entities (and their code) are hydrated.
+   */
+  async findBestScoresByUserAndQuestions(userId: string, questionIds: string[]): Promise<Map<string, number>> {
+    const bestScores = new Map<string, number>();
+    if (questionIds.length === 0) {
+      return bestScores;
+    }
+
+    const rawData = await this.repository.createQueryBuilder('submission')
+      .select('submission.questionId', 'questionId')
+      .addSelect('MAX(submission.score)', 'bestScore')
+      .where('submission.userId = :userId', { userId })
+      .andWhere('submission.questionId IN (:...questionIds)', { questionIds })
+      .groupBy('submission.questionId')
+      .getRawMany();
+
+    rawData.forEach(row => {
+      bestScores.set(row.questionId, Number(row.bestScore) || 0);
+    });
+
+    return bestScores;
+  }
+
   async findWithResults(id: string): Promise<Submission | null> {
     return this.repository.findOne({
       where: { id },
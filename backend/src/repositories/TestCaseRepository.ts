@@ -2,6 +2,9 @@ import { injectable } from 'tsyringe';
 import { BaseRepository } from './BaseRepository';
 import { TestCase } from '../models/TestCase';
 
+// Rows per bulk UPDATE statement, 5 parameters each (PostgreSQL allows at most 65535 per query)
+const UPDATE_CHUNK_SIZE = 1000;
+
 @injectable()
 export class TestCaseRepository extends BaseRepository<TestCase> {
   constructor() {
@@ -11,7 +14,7 @@ export class TestCaseRepository extends BaseRepository<TestCase> {
   async findByQuestion(questionId: string): Promise<TestCase[]> {
     return this.repository.find({
       where: { questionId },
-      order: { createdAt: 'ASC' }
+      order: { position: 'ASC' }
     });
   }
 
@@ -24,6 +27,39 @@ export class TestCaseRepository extends BaseRepository<TestCase> {
     return result.affected || 0;
   }
 
+  /**
+   * Applies a bulk edit in one transaction: inserts the new test cases, updates the edited ones with
+   * one UPDATE ... FROM (VALUES ...) statement per chunk and deletes the removed ones.
+   * Returns the inserted rows.
+   */
+  async applyBulkEdit(toCreate: TestCase[], toUpdate: TestCase[], idsToDelete: string[]): Promise<TestCase[]> {
+    return this.repository.manager.transaction(async manager => {
+      const created = toCreate.length > 0 ? await manager.save(TestCase, toCreate) : [];
+
+      for (let start = 0; start < toUpdate.length; start += UPDATE_CHUNK_SIZE) {
+        const params: unknown[] = [];
+        const values = toUpdate.slice(start, start + UPDATE_CHUNK_SIZE).map(tc => {
+          params.push(tc.id, tc.input, tc.expectedOutput, tc.weight, tc.isHidden);
+          const n = params.length;
+          return `($${n - 4}::uuid, $${n - 3}::text, $${n - 2}::text, $${n - 1}::int, $${n}::boolean)`;
+        });
+        await manager.query(
+          `UPDATE "test_cases" AS tc
+           SET "input" = v.input, "expected_output" = v.expected_output, "weight" = v.weight, "is_hidden" = v.is_hidden
+           FROM (VALUES ${values.join(', ')}) AS v(id, input, expected_output, weight, is_hidden)
+           WHERE tc."id" = v.id`,
+          params
+        );
+      }
+
+      if (idsToDelete.length > 0) {
+        await manager.delete(TestCase, idsToDelete);
+      }
+
+      return created;
+    });
+  }
+
   /**
    * Find test case by question ID and input/output combination
    * Used to check for duplicates
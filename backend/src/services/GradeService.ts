@@ -137,20 +137,7 @@ export class GradeService {
 
     const questionIds = questionList.questions.map(q => q.id);
 
-    const allSubmissions = await Promise.all(
-      questionIds.map(questionId =>
-        this.submissionRepository.findByUserAndQuestion(studentId, questionId)
-      )
-    );
-
-    const bestScoresByQuestion = new Map<string, number>();
-
-    allSubmissions.flat().forEach(submission => {
-      const currentBest = bestScoresByQuestion.get(submission.questionId) || 0;
-      if (submission.score > currentBest) {
-        bestScoresByQuestion.set(submission.questionId, submission.score);
-      }
-    });
+    const bestScoresByQuestion = await this.submissionRepository.findBestScoresByUserAndQuestions(studentId, questionIds);
 
     logger.debug('Best scores per question', {
       studentId,
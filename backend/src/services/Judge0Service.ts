@@ -222,15 +222,14 @@ export class Judge0Service {
         const stderr = decode(judge0Status.stderr);
         const compileOutput = decode(judge0Status.compile_output);
         const message = decode(judge0Status.message);
+        const output = stdout?.trim(); // trimmed once, used for comparison and result
 
         let verdict = this.mapStatusToVerdict(judge0Status.status.id);
         let passed = false;
 
         if (judge0Status.status.id === 3) { // Accepted
             if (expectedOutput) {
-                const actualTrimmed = (stdout || '').trim();
-                const expectedTrimmed = expectedOutput.trim();
-                passed = actualTrimmed === expectedTrimmed;
+                passed = (output || '') === expectedOutput.trim();
                 if (!passed) {
                     verdict = JudgeVerdict.WRONG_ANSWER;
                 }
@@ -244,7 +243,7 @@ export class Judge0Service {
             passed,
             executionTimeMs: judge0Status.time ? parseFloat(judge0Status.time) * 1000 : undefined,
             memoryUsedKb: judge0Status.memory,
-            output: stdout?.trim(),
+            output,
             errorMessage: stderr || compileOutput || message
         };
     }
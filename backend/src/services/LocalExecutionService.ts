@@ -237,15 +237,14 @@ export class LocalExecutionService {
         const stderr = decode(status.stderr);
         const compileOutput = decode(status.compile_output);
         const message = decode(status.message);
+        const output = stdout?.trim(); // trimmed once, used for comparison and result
 
         let verdict = this.mapStatusToVerdict(status.status.id);
         let passed = false;
 
         if (status.status.id === 3) { // Accepted
             if (expectedOutput) {
-                const actualTrimmed = (stdout || '').trim();
-                const expectedTrimmed = expectedOutput.trim();
-                passed = actualTrimmed === expectedTrimmed;
+                passed = (output || '') === expectedOutput.trim();
                 if (!passed) {
                     verdict = JudgeVerdict.WRONG_ANSWER;
                 }
@@ -259,7 +258,7 @@ export class LocalExecutionService {
             passed,
             executionTimeMs: status.time ? parseFloat(status.time) * 1000 : undefined,
             memoryUsedKb: status.memory,
-            output: stdout?.trim(),
+            output,
             errorMessage: stderr || compileOutput || message
         };
     }
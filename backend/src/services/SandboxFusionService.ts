@@ -7,9 +7,11 @@
 import { injectable } from 'tsyringe';
 import { v4 as uuidv4 } from 'uuid';
 import axios from 'axios';
+import * as http from 'http';
+import { performance } from 'perf_hooks';
 import { ProgrammingLanguage } from '../enums/ProgrammingLanguage';
 import { JudgeVerdict } from '../enums/JudgeVerdict';
-import { logger } from '../utils';
+import { logger, LruCache, hashCacheKey } from '../utils';
 import {
     Judge0StatusResponse,
     ProcessedSubmissionResult
@@ -26,6 +28,7 @@ interface ExecutionResult {
     time?: string;
     memory?: number;
     createdAt: number;
+    finishedAt?: number; // set when the result reaches a final status; the TTL is measured from here
 }
 
 /**
@@ -58,11 +61,115 @@ class Semaphore {
     }
 }
 
+interface ExecutorLatencyStats {
+    count: number;
+    errors: number;
+    totalMs: number;
+    maxMs: number;
+}
+
+interface ExecutorEndpoints {
+    run: string;
+    check: string;
+    language: 'java' | 'python'; // Language identifier expected by the executor
+}
+
+/**
+ * Executor URLs per language, resolved once instead of on every execution
+ */
+const EXECUTOR_ENDPOINTS: Partial<Record<ProgrammingLanguage, ExecutorEndpoints>> = {
+    [ProgrammingLanguage.PYTHON]: {
+        run: 'http://ataljudge-executor-python:3000/run',
+        check: 'http://ataljudge-executor-python:3000/check',
+        language: 'python'
+    },
+    [ProgrammingLanguage.JAVA]: {
+        run: 'http://ataljudge-executor-java:3000/run',
+        check: 'http://ataljudge-executor-java:3000/check',
+        language: 'java'
+    }
+};
+
+/**
+ * Judge0-style status id -> verdict. Unknown ids map to JUDGE_ERROR.
+ */
+const STATUS_VERDICTS: Readonly<Record<number, JudgeVerdict>> = {
+    3: JudgeVerdict.ACCEPTED,
+    4: JudgeVerdict.WRONG_ANSWER,
+    5: JudgeVerdict.TIME_LIMIT_EXCEEDED,
+    6: JudgeVerdict.COMPILATION_ERROR,
+    7: JudgeVerdict.RUNTIME_ERROR,
+    8: JudgeVerdict.RUNTIME_ERROR,
+    9: JudgeVerdict.RUNTIME_ERROR,
+    10: JudgeVerdict.RUNTIME_ERROR,
+    11: JudgeVerdict.RUNTIME_ERROR,
+    12: JudgeVerdict.RUNTIME_ERROR,
+    13: JudgeVerdict.INTERNAL_ERROR,
+    14: JudgeVerdict.MEMORY_LIMIT_EXCEEDED
+};
+
+// Memory-limit markers in a failed run's stderr, matched in one scan
+const OUT_OF_MEMORY_PATTERN = /OutOfMemory|Java heap space/;
+
+// Python run command is identical for every submission
+const PYTHON_RUN_ARGS: readonly string[] = ['-u', 'main.py'];
+
+/**
+ * Request body limit of the executors (their body-parser limit). Set EXECUTOR_MAX_BODY_BYTES to the
+ * same value on the backend and the executors; payloads are checked against it before being sent.
+ */
+const EXECUTOR_MAX_BODY_BYTES = parseInt(process.env.EXECUTOR_MAX_BODY_BYTES || '', 10) || 10 * 1024 * 1024;
+
+/**
+ * In-flight runs per language executor. Runs of a batch fan out up to this limit; raise it
+ * together with the executor's MAX_CONCURRENT_RUNS on hosts with more cores.
+ */
+const configuredConcurrency = parseInt(process.env.EXECUTOR_CONCURRENCY || '', 10);
+const EXECUTOR_CONCURRENCY = configuredConcurrency >= 1 ? configuredConcurrency : 4;
+if (process.env.EXECUTOR_CONCURRENCY && EXECUTOR_CONCURRENCY !== configuredConcurrency) {
+    logger.warn(`Invalid EXECUTOR_CONCURRENCY "${process.env.EXECUTOR_CONCURRENCY}", using ${EXECUTOR_CONCURRENCY}`);
+}
+
+/**
+ * Longest an executor lets a request wait for a run slot before answering 503 (its
+ * EXECUTOR_MAX_QUEUE_WAIT_MS; set the same value on both sides). Added to every request timeout so
+ * queueing never eats into a program's time limit; busy responses are retried, not judged.
+ */
+const configuredQueueWait = parseInt(process.env.EXECUTOR_MAX_QUEUE_WAIT_MS || '', 10);
+const EXECUTOR_MAX_QUEUE_WAIT_MS = configuredQueueWait >= 0 ? configuredQueueWait : 10000;
+if (process.env.EXECUTOR_MAX_QUEUE_WAIT_MS && EXECUTOR_MAX_QUEUE_WAIT_MS !== configuredQueueWait) {
+    logger.warn(`Invalid EXECUTOR_MAX_QUEUE_WAIT_MS "${process.env.EXECUTOR_MAX_QUEUE_WAIT_MS}", using ${EXECUTOR_MAX_QUEUE_WAIT_MS}`);
+}
+const EXECUTOR_BUSY_RETRIES = 3;
+const EXECUTOR_BUSY_RETRY_DELAY_MS = 1000;
+
+/**
+ * Shared HTTP client for executor calls. Keep-alive sockets are reused across
+ * submissions instead of opening a new TCP connection per test case. Each language has its
+ * own executor host, so the per-host pool is sized from EXECUTOR_CONCURRENCY, plus headroom
+ * for syntax checks, which do not go through the run semaphore. Idle sockets are dropped after 60s,
+ * before the executor's 65s keepAliveTimeout closes them under a request (ECONNRESET).
+ */
+const executorClient = axios.create({
+    httpAgent: new http.Agent({ keepAlive: true, maxSockets: EXECUTOR_CONCURRENCY + 2, timeout: 60000 })
+});
+
 @injectable()
 export class SandboxFusionService {
     private results: Map<string, ExecutionResult> = new Map();
     private semaphores: Map<string, Semaphore> = new Map();
-    private readonly MAX_CONCURRENCY = 4; // limit per language executor
+    private readonly MAX_CONCURRENCY = EXECUTOR_CONCURRENCY;
+    private readonly RESULT_TTL_MS = 10 * 60 * 1000; // finished results are kept well past any poll timeout
+    private readonly EVICTION_INTERVAL_MS = 60 * 1000;
+    private lastEvictionAt = 0;
+    private circuits: Map<string, { failures: number; openedAt: number }> = new Map();
+    private readonly CIRCUIT_FAILURE_THRESHOLD = 3; // consecutive connection failures before opening
+    private readonly CIRCUIT_COOLDOWN_MS = 30 * 1000;
+    private latencyStats: Map<string, ExecutorLatencyStats> = new Map();
+    // Resolvers of callers waiting for any submission to finish (see waitForCompletionSignal)
+    private completionWaiters: Array<() => void> = [];
+    // Compilation outcome depends only on (language, source), so check results are memoized
+    private syntaxCheckCache = new LruCache<string, { success: boolean; unavailable?: boolean; errorMessage?: string }>(500);
 
     constructor() { }
 
@@ -128,10 +235,12 @@ export class SandboxFusionService {
                 id: result.statusId,
                 description: result.statusDescription
             },
-            stdout: result.stdout ? Buffer.from(result.stdout).toString('base64') : null,
-            stderr: result.stderr ? Buffer.from(result.stderr).toString('base64') : null,
-            compile_output: result.compileOutput ? Buffer.from(result.compileOutput).toString('base64') : null,
-            message: result.message ? Buffer.from(result.message).toString('base64') : null,
+            // Plain text: the only consumer is processSubmissionResult below, so the
+            // Judge0-style base64 encoding would just be undone on the next call
+            stdout: result.stdout || null,
+            stderr: result.stderr || null,
+            compile_output: result.compileOutput || null,
+            message: result.message || null,
             time: result.time,
             memory: result.memory
         } as any;
@@ -176,7 +285,7 @@ export class SandboxFusionService {
                 return statuses;
             }
 
-            await new Promise(resolve => setTimeout(resolve, intervalMs));
+            await this.waitForCompletionSignal(intervalMs);
         }
 
         throw new Error('Timeout waiting for submissions');
@@ -195,7 +304,7 @@ export class SandboxFusionService {
             if (status.status.id > 2) {
                 return status;
             }
-            await new Promise(resolve => setTimeout(resolve, intervalMs));
+            await this.waitForCompletionSignal(intervalMs);
         }
         throw new Error(`Timeout waiting for submission ${token}`);
     }
@@ -204,21 +313,18 @@ export class SandboxFusionService {
         status: Judge0StatusResponse,
         expectedOutput?: string
     ): ProcessedSubmissionResult {
-        const decode = (str?: string) => str ? Buffer.from(str, 'base64').toString('utf-8') : undefined;
-
-        const stdout = decode(status.stdout);
-        const stderr = decode(status.stderr);
-        const compileOutput = decode(status.compile_output);
-        const message = decode(status.message);
+        const stdout = status.stdout || undefined;
+        const stderr = status.stderr || undefined;
+        const compileOutput = status.compile_output || undefined;
+        const message = status.message || undefined;
+        const output = stdout?.trim(); // trimmed once, used for comparison and result
 
         let verdict = this.mapStatusToVerdict(status.status.id);
         let passed = false;
 
         if (status.status.id === 3) { // Accepted
             if (expectedOutput) {
-                const actualTrimmed = (stdout || '').trim();
-                const expectedTrimmed = expectedOutput.trim();
-                passed = actualTrimmed === expectedTrimmed;
+                passed = (output || '') === expectedOutput.trim();
                 if (!passed) {
                     verdict = JudgeVerdict.WRONG_ANSWER;
                 }
@@ -232,14 +338,86 @@ export class SandboxFusionService {
             passed,
             executionTimeMs: status.time ? Math.round(parseFloat(status.time) * 1000) : undefined,
             memoryUsedKb: status.memory,
-            output: stdout?.trim(),
+            output,
             errorMessage: stderr || compileOutput || message
         };
     }
 
+    /**
+     * Validates that the source compiles without executing it.
+     * Useful to fail fast before dispatching a batch of executions of the same code.
+     */
+    async checkSyntax(
+        sourceCode: string,
+        language: ProgrammingLanguage
+    ): Promise<{ success: boolean; unavailable?: boolean; errorMessage?: string }> {
+        const cacheKey = hashCacheKey(language, sourceCode);
+        const cached = this.syntaxCheckCache.get(cacheKey);
+        if (cached) {
+            return cached;
+        }
+
+        // Same breaker as executions: do not wait on a compile timeout against an executor known to be down
+        if (this.isCircuitOpen(language)) {
+            return { success: false, unavailable: true, errorMessage: `Executor for ${language} is unavailable` };
+        }
+
+        // Executor failures (5xx, timeout, connection refused) and languages without an executor are not
+        // a compile verdict: report them as unavailable and do not cache them, so callers can skip the
+        // pre-check instead of failing
+        try {
+            const endpoints = this.getExecutorEndpoints(language);
+            const response = await this.postToExecutor(language, endpoints.check, JSON.stringify({
+                code: sourceCode,
+                language: endpoints.language
+            }), 70000 + EXECUTOR_MAX_QUEUE_WAIT_MS); // Executor queue wait + compile timeout (60s) + overhead
+
+            const result = {
+                success: response.data.success === true,
+                errorMessage: response.data.stderr || undefined
+            };
+            this.syntaxCheckCache.set(cacheKey, result);
+            return result;
+        } catch (error: any) {
+            const errorMessage = error.response?.data?.error || error.message;
+            logger.warn(`Syntax check unavailable for ${language}: ${errorMessage}`);
+            return { success: false, unavailable: true, errorMessage };
+        }
+    }
+
+    /**
+     * Per-language executor round-trip latency since process start (includes queueing in the executor,
+     * compilation and run time). Exposed on /health to compare executors and tune limits.
+     */
+    getExecutorLatencyStats(): Record<string, { count: number; errors: number; avgMs: number; maxMs: number }> {
+        const stats: Record<string, { count: number; errors: number; avgMs: number; maxMs: number }> = {};
+        for (const [language, entry] of this.latencyStats) {
+            stats[language] = {
+                count: entry.count,
+                errors: entry.errors,
+                avgMs: entry.count > 0 ? Math.round(entry.totalMs / entry.count) : 0,
+                maxMs: Math.round(entry.maxMs)
+            };
+        }
+        return stats;
+    }
+
     // --- Internal Implementation ---
 
+    private recordLatency(language: ProgrammingLanguage, elapsedMs: number, ok: boolean) {
+        let entry = this.latencyStats.get(language);
+        if (!entry) {
+            entry = { count: 0, errors: 0, totalMs: 0, maxMs: 0 };
+            this.latencyStats.set(language, entry);
+        }
+        entry.count++;
+        entry.totalMs += elapsedMs;
+        if (elapsedMs > entry.maxMs) entry.maxMs = elapsedMs;
+        if (!ok) entry.errors++;
+    }
+
     private initializeSubmission(token: string) {
+        this.evictExpiredResults();
         this.results.set(token, {
             token,
             statusId: 1, // In Queue
@@ -248,6 +426,24 @@ export class SandboxFusionService {
         });
     }
 
+    /**
+     * Drops results finished more than RESULT_TTL_MS ago so the map (and the stdout/stderr it holds)
+     * does not grow for the lifetime of the process. Runs at most once per EVICTION_INTERVAL_MS.
+     */
+    private evictExpiredResults() {
+        const now = Date.now();
+        if (now - this.lastEvictionAt < this.EVICTION_INTERVAL_MS) {
+            return;
+        }
+        this.lastEvictionAt = now;
+
+        for (const [token, result] of this.results) {
+            if (result.finishedAt !== undefined && now - result.finishedAt > this.RESULT_TTL_MS) {
+                this.results.delete(token);
+            }
+        }
+    }
+
     private updateStatus(token: string, statusId: number, description: string, data?: Partial<ExecutionResult>) {
         const current = this.results.get(token);
         if (current) {
@@ -255,11 +451,41 @@ export class SandboxFusionService {
                 ...current,
                 statusId,
                 statusDescription: description,
-                ...data
+                ...data,
+                finishedAt: statusId > 2 ? Date.now() : undefined
             });
+            if (statusId > 2) {
+                this.notifyCompletion();
+            }
         }
     }
 
+    /**
+     * Resolves as soon as any submission finishes, or after maxWaitMs at the latest.
+     * Lets the wait loops react to results immediately instead of sleeping a full poll interval.
+     */
+    private waitForCompletionSignal(maxWaitMs: number): Promise<void> {
+        return new Promise<void>((resolve) => {
+            const wake = () => {
+                clearTimeout(timer);
+                resolve();
+            };
+            const timer = setTimeout(() => {
+                const index = this.completionWaiters.indexOf(wake);
+                if (index !== -1) this.completionWaiters.splice(index, 1);
+                resolve();
+            }, maxWaitMs);
+            this.completionWaiters.push(wake);
+        });
+    }
+
+    private notifyCompletion() {
+        if (this.completionWaiters.length === 0) return;
+        const waiters = this.completionWaiters;
+        this.completionWaiters = [];
+        waiters.forEach(wake => wake());
+    }
+
     private async executeSubmissionHttp(
         token: string,
         sourceCode: string,
@@ -269,19 +495,39 @@ export class SandboxFusionService {
     ) {
         logger.info(`[SandboxFusion-HTTP] Preparing execution for ${token}`, { language });
 
+        // Fail fast while the executor is known to be unreachable instead of queueing behind timeouts
+        if (this.isCircuitOpen(language)) {
+            logger.warn(`[SandboxFusion-HTTP] Circuit open for ${language} executor, skipping ${token}`);
+            this.updateStatus(token, 13, 'Internal Error', { message: `Executor for ${language} is unavailable` });
+            return;
+        }
+
         // Get or create semaphore for this language
-        if (!this.semaphores.has(language)) {
-            this.semaphores.set(language, new Semaphore(this.MAX_CONCURRENCY));
+        let semaphore = this.semaphores.get(language);
+        if (!semaphore) {
+            semaphore = new Semaphore(this.MAX_CONCURRENCY);
+            this.semaphores.set(language, semaphore);
         }
-        const semaphore = this.semaphores.get(language)!;
 
         await semaphore.acquire();
 
         try {
-            this.updateStatus(token, 2, 'Processing');
+            const endpoints = this.getExecutorEndpoints(language);
+            const endpoint = endpoints.run;
+            const payload = this.getExecutorPayload(language, endpoints, sourceCode, stdin, limits);
+
+            // Oversized bodies would only come back as a 413 after a full upload. The executor limit applies
+            // to the JSON body, where escaping of quotes, newlines and control characters adds bytes.
+            // The body is serialized once: the same string is measured and posted
+            const body = JSON.stringify(payload);
+            const payloadBytes = Buffer.byteLength(body);
+            if (payloadBytes > EXECUTOR_MAX_BODY_BYTES) {
+                logger.warn(`[SandboxFusion-HTTP] Payload too large for ${token}`, { payloadBytes });
+                this.updateStatus(token, 13, 'Internal Error', { message: 'Source code and input exceed the executor size limit' });
+                return;
+            }
 
-            const endpoint = this.getExecutorEndpoint(language);
-            const payload = this.getExecutorPayload(language, sourceCode, stdin, limits);
+            this.updateStatus(token, 2, 'Processing');
 
             logger.info(`[SandboxFusion-HTTP] Posting to ${endpoint}`);
 
@@ -289,14 +535,17 @@ export class SandboxFusionService {
             // Default: Java 3s, Python 2s if not specified
             const defaultLimit = language === ProgrammingLanguage.JAVA ? 3 : 2;
             const cpuLimit = limits?.cpuTimeLimit || defaultLimit;
-            const axiosTimeout = (cpuLimit * 1000) + 15000;
+            const axiosTimeout = (cpuLimit * 1000) + 15000 + EXECUTOR_MAX_QUEUE_WAIT_MS;
 
-            const response = await axios.post(endpoint, payload, {
-                timeout: axiosTimeout
-            });
+            const response = await this.postToExecutor(language, endpoint, body, axiosTimeout);
 
             const result = response.data;
-            logger.info(`[SandboxFusion-HTTP] Result received`, result);
+            // The full payload carries stdout/stderr; only pay for serializing it when debug logging is on
+            if (logger.isDebugEnabled()) {
+                logger.debug(`[SandboxFusion-HTTP] Result received`, result);
+            } else {
+                logger.info(`[SandboxFusion-HTTP] Result received`, { exitCode: result.exitCode, time: result.time });
+            }
 
             if (result.error) {
                 this.updateStatus(token, 13, 'Internal Error', { message: result.error });
@@ -305,9 +554,12 @@ export class SandboxFusionService {
 
             // Map exit code to verdict
             if (result.exitCode !== 0) {
-                if (result.stderr && result.stderr.includes('Time Limit Exceeded')) {
+                const stderr: string = result.stderr || '';
+                // Prefer the executor's structured flag; stderr matching covers older executor images
+                const timedOut = result.timedOut ?? stderr.includes('Time Limit Exceeded');
+                if (timedOut) {
                     this.updateStatus(token, 5, 'Time Limit Exceeded', { time: '5.0' });
-                } else if (result.stderr && (result.stderr.includes('OutOfMemory') || result.stderr.includes('Java heap space'))) {
+                } else if (OUT_OF_MEMORY_PATTERN.test(stderr)) {
                     this.updateStatus(token, 14, 'Memory Limit Exceeded', {
                         memory: limits?.memoryLimit || 0,
                         stderr: result.stderr
@@ -341,25 +593,89 @@ export class SandboxFusionService {
                 return;
             }
 
-            this.updateStatus(token, 13, 'Internal Error', { message: error.message });
+            this.updateStatus(token, 13, 'Internal Error', { message: error.response?.data?.error || error.message });
         } finally {
             semaphore.release();
         }
     }
 
-    private getExecutorEndpoint(language: ProgrammingLanguage): string {
-        switch (language) {
-            case ProgrammingLanguage.PYTHON:
-                return 'http://ataljudge-executor-python:3000/run';
-            case ProgrammingLanguage.JAVA:
-                return 'http://ataljudge-executor-java:3000/run';
-            default:
-                throw new Error(`Language ${language} not supported.`);
+    /**
+     * Single path for every executor call (run and check): records latency and feeds the
+     * circuit breaker. Only a missing HTTP response counts as an executor failure; timeouts
+     * are the program's verdict and error responses come from a live executor. A 503 means
+     * the executor had no free run slot, so nothing ran: the request is retried after a pause.
+     * The body is an already serialized JSON string and is sent as is: axios would otherwise
+     * re-parse a string body to validate it.
+     */
+    private async postToExecutor(
+        language: ProgrammingLanguage,
+        endpoint: string,
+        body: string,
+        timeoutMs: number
+    ) {
+        for (let attempt = 0; ; attempt++) {
+            const requestStartedAt = performance.now();
+            try {
+                const response = await executorClient.post(endpoint, body, {
+                    timeout: timeoutMs,
+                    headers: { 'Content-Type': 'application/json' },
+                    transformRequest: [(data: string) => data]
+                });
+                this.recordLatency(language, performance.now() - requestStartedAt, true);
+                this.recordExecutorSuccess(language);
+                return response;
+            } catch (error: any) {
+                this.recordLatency(language, performance.now() - requestStartedAt, false);
+                if (error.response?.status === 503 && attempt < EXECUTOR_BUSY_RETRIES) {
+                    logger.warn(`[SandboxFusion-HTTP] ${language} executor busy, retrying`, { attempt: attempt + 1 });
+                    await new Promise(resolve => setTimeout(resolve, EXECUTOR_BUSY_RETRY_DELAY_MS * (attempt + 1)));
+                    continue;
+                }
+                if (!error.response && error.code !== 'ECONNABORTED') {
+                    this.recordExecutorFailure(language);
+                }
+                throw error;
+            }
         }
     }
 
+    private isCircuitOpen(language: ProgrammingLanguage): boolean {
+        const circuit = this.circuits.get(language);
+        return !!circuit
+            && circuit.failures >= this.CIRCUIT_FAILURE_THRESHOLD
+            && Date.now() - circuit.openedAt < this.CIRCUIT_COOLDOWN_MS;
+    }
+
+    private recordExecutorSuccess(language: ProgrammingLanguage) {
+        this.circuits.delete(language);
+    }
+
+    /**
+     * Counts consecutive connection failures; once the threshold is reached the circuit opens
+     * for CIRCUIT_COOLDOWN_MS. After the cooldown requests are let through again, and a single
+     * further failure re-opens it.
+     */
+    private recordExecutorFailure(language: ProgrammingLanguage) {
+        const circuit = this.circuits.get(language) || { failures: 0, openedAt: 0 };
+        circuit.failures++;
+        if (circuit.failures >= this.CIRCUIT_FAILURE_THRESHOLD) {
+            circuit.openedAt = Date.now();
+            logger.warn(`[SandboxFusion-HTTP] Opening circuit for ${language} executor`, { failures: circuit.failures });
+        }
+        this.circuits.set(language, circuit);
+    }
+
+    private getExecutorEndpoints(language: ProgrammingLanguage): ExecutorEndpoints {
+        const endpoints = EXECUTOR_ENDPOINTS[language];
+        if (!endpoints) {
+            throw new Error(`Language ${language} not supported.`);
+        }
+        return endpoints;
+    }
+
     private getExecutorPayload(
         language: ProgrammingLanguage,
+        endpoints: ExecutorEndpoints,
         code: string,
         stdin: string | undefined,
         limits: any
@@ -367,7 +683,7 @@ export class SandboxFusionService {
         const base = {
             code,
             stdin: stdin || '', // Empty string if undefined
-            language: language === ProgrammingLanguage.JAVA ? 'java' : 'python',
+            language: endpoints.language,
             cpuTimeLimit: limits?.cpuTimeLimit
         };
 
@@ -375,7 +691,7 @@ export class SandboxFusionService {
             return {
                 ...base,
                 cmd: 'python3',
-                args: ['-u', 'main.py']
+                args: PYTHON_RUN_ARGS
             };
         } else {
             // Java specific arguments
@@ -400,20 +716,6 @@ export class SandboxFusionService {
     }
 
     private mapStatusToVerdict(statusId: number): JudgeVerdict {
-        switch (statusId) {
-            case 3: return JudgeVerdict.ACCEPTED;
-            case 4: return JudgeVerdict.WRONG_ANSWER;
-            case 5: return JudgeVerdict.TIME_LIMIT_EXCEEDED;
-            case 6: return JudgeVerdict.COMPILATION_ERROR;
-            case 7:
-            case 8:
-            case 9:
-            case 10:
-            case 11:
-            case 12: return JudgeVerdict.RUNTIME_ERROR;
-            case 13: return JudgeVerdict.INTERNAL_ERROR;
-            case 14: return JudgeVerdict.MEMORY_LIMIT_EXCEEDED;
-            default: return JudgeVerdict.JUDGE_ERROR;
-        }
+        return STATUS_VERDICTS[statusId] ?? JudgeVerdict.JUDGE_ERROR;
     }
 }
@@ -53,6 +53,8 @@ export class SubmissionQueueService {
         backoff: {
           type: 'exponential',
           delay: 2000,
+          // Spread retries so jobs that failed together (executor restart) do not all retry at once
+          jitter: 0.5,
         },
         removeOnComplete: {
           age: 3600,
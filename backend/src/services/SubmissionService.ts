@@ -267,18 +267,26 @@ export class SubmissionService {
         throw new Error('Submission not found');
       }
 
-      await this.submissionRepository.update(submissionId, {
-        status: SubmissionStatus.PROCESSING
-      });
-
-      const question = await this.questionRepository.findWithTestCases(submission.questionId);
+      // Only needed for the grade update at the end; fetched now so it overlaps with judging.
+      // Marked as handled here so an early failure below does not leave an unhandled rejection.
+      const questionListPromise = this.questionListRepository.findByQuestionId(submission.questionId);
+      questionListPromise.catch(() => { });
+
+      // The status update, question and test cases are independent, so they are loaded concurrently.
+      // Test cases are not joined on the question; that would fetch every input/output twice.
+      logger.debug('Fetching question and test cases', { submissionId, questionId: submission.questionId });
+      const [, question, testCases] = await Promise.all([
+        this.submissionRepository.update(submissionId, {
+          status: SubmissionStatus.PROCESSING
+        }),
+        this.questionRepository.findById(submission.questionId),
+        this.testCaseRepository.findByQuestion(submission.questionId)
+      ]);
       if (!question) {
         logger.error('Question not found', { submissionId, questionId: submission.questionId });
         throw new NotFoundError('Question not found', 'QUESTION_NOT_FOUND');
       }
 
-      logger.debug('Fetching test cases', { submissionId, questionId: question.id });
-      const testCases = await this.testCaseRepository.findByQuestion(question.id);
       if (testCases.length === 0) {
         logger.error('Question without test cases', { submissionId, questionId: question.id });
         throw new ValidationError('Question does not have test cases', 'NO_TEST_CASES');
@@ -286,9 +294,11 @@ export class SubmissionService {
 
       logger.info('Test cases loaded', {
         submissionId,
-        totalTestCases: testCases.length,
-        testCaseIds: testCases.map(tc => tc.id)
+        totalTestCases: testCases.length
       });
+      if (logger.isDebugEnabled()) {
+        logger.debug('Test case ids', { submissionId, testCaseIds: testCases.map(tc => tc.id) });
+      }
 
       const limits = {
         cpuTimeLimit: question.getCpuTimeLimitSeconds(),
@@ -482,12 +492,26 @@ export class SubmissionService {
         hasCompilationError
       });
 
-      await this.submissionResultRepository.createMany(submissionResults);
-
-      const totalWeight = testCases.reduce((sum, tc) => sum + tc.weight, 0);
-      const earnedWeight = testCases.reduce((sum, tc, index) => {
-        return sum + (submissionResults[index].passed ? tc.weight : 0);
-      }, 0);
+      // Outputs are only truncated for storage; comparison and checkers above used the full text
+      await this.submissionResultRepository.createMany(submissionResults.map(result => ({
+        ...result,
+        output: this.truncateStoredOutput(result.output),
+        errorMessage: this.truncateStoredOutput(result.errorMessage)
+      })));
+
+      // Single pass over the results: weights and the first failing test case
+      let totalWeight = 0;
+      let earnedWeight = 0;
+      let firstFailedResult: (typeof submissionResults)[number] | undefined;
+      for (let i = 0; i < testCases.length; i++) {
+        const result = submissionResults[i];
+        totalWeight += testCases[i].weight;
+        if (result.passed) {
+          earnedWeight += testCases[i].weight;
+        } else if (!firstFailedResult) {
+          firstFailedResult = result;
+        }
+      }
 
       const score = totalWeight > 0 ? Math.round((earnedWeight / totalWeight) * 100) : 0;
 
@@ -501,8 +525,7 @@ export class SubmissionService {
       } else if (passedTests === testCases.length) {
         finalVerdict = JudgeVerdict.ACCEPTED;
       } else {
-        const failedResult = submissionResults.find(r => !r.passed);
-        finalVerdict = failedResult?.verdict || JudgeVerdict.WRONG_ANSWER;
+        finalVerdict = firstFailedResult?.verdict || JudgeVerdict.WRONG_ANSWER;
       }
 
       await this.submissionRepository.update(submissionId, {
@@ -517,7 +540,7 @@ export class SubmissionService {
       });
 
       try {
-        const questionList = await this.questionListRepository.findByQuestionId(submission.questionId);
+        const questionList = await questionListPromise;
         if (questionList) {
           await this.gradeService.recalculateAndUpsertGrade(
             submission.userId,
@@ -642,5 +665,16 @@ export class SubmissionService {
       testResults
     });
   }
+
+  /**
+   * Caps a per-test-case output at MAX_OUTPUT_SIZE_KB before it is persisted
+   */
+  private truncateStoredOutput(text?: string): string | undefined {
+    const maxLength = config.limits.maxOutputSizeKB * 1024;
+    if (!text || text.length <= maxLength) {
+      return text;
+    }
+    return `${text.slice(0, maxLength)}\n... (truncated)`;
+  }
 }
 
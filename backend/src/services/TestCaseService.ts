@@ -165,11 +165,8 @@ export class TestCaseService {
    * @returns {Promise<void>}
    */
   async deleteTestCasesByQuestion(questionId: string): Promise<void> {
-    const testCases = await this.testCaseRepository.findByQuestion(questionId);
-    
-    for (const testCase of testCases) {
-      await this.testCaseRepository.delete(testCase.id);
-    }
+    // Single DELETE; no need to load every input/output into memory first
+    await this.testCaseRepository.deleteByQuestion(questionId);
   }
 }
 
@@ -19,13 +19,9 @@ export class GetClassStudentsUseCase implements IUseCase<string, UserResponseDTO
       throw new NotFoundError('Class not found', 'CLASS_NOT_FOUND');
     }
 
-    // If students are not loaded via relation, fetch them directly
-    let students = classEntity.students || [];
-    
-    // Fallback: if relation didn't load students, use findStudents method
-    if (students.length === 0) {
-      students = await this.classRepository.findStudents(classId);
-    }
+    // The join yields an empty array for a class without students; only
+    // fall back to findStudents when the relation was not loaded at all
+    const students = classEntity.students ?? await this.classRepository.findStudents(classId);
 
     return students.map(s => UserMapper.toDTO(s));
   }
@@ -46,13 +46,9 @@ export class CalculateGradeUseCase implements IUseCase<CalculateGradeUseCaseInpu
       return this.createOrUpdateGrade(studentId, questionListId, 0);
     }
 
-    // 3. Find all student submissions for list questions
+    // 3. Find the student's best score for each list question
     const questionIds = questionList.questions!.map(q => q.id);
-    const allSubmissions = await Promise.all(
-      questionIds.map(questionId =>
-        this.submissionRepository.findByUserAndQuestion(studentId, questionId)
-      )
-    );
+    const bestScoresByQuestion = await this.submissionRepository.findBestScoresByUserAndQuestions(studentId, questionIds);
 
     // 4. Calculate score
     let totalScore = 0;
@@ -61,9 +57,8 @@ export class CalculateGradeUseCase implements IUseCase<CalculateGradeUseCaseInpu
       // Group system: best submission per group
       const groupBestScores = new Map<string, number>();
 
-      questionList.questions!.forEach((question, index) => {
-        const submissions = allSubmissions[index];
-        const bestScore = this.getBestScore(submissions);
+      questionList.questions!.forEach(question => {
+        const bestScore = bestScoresByQuestion.get(question.id) || 0;
         const group = questionList.getQuestionGroup(question.id);
 
         if (group) {
@@ -87,7 +82,7 @@ export class CalculateGradeUseCase implements IUseCase<CalculateGradeUseCaseInpu
       });
     } else {
       // Simple system: best scores taking into account minQuestionsForMaxScore
-      const scores = allSubmissions.map(submissions => this.getBestScore(submissions));
+      const scores = questionIds.map(questionId => bestScoresByQuestion.get(questionId) || 0);
       // Sort scores descending to pick the best ones
       scores.sort((a, b) => b - a);
 
@@ -120,14 +115,6 @@ export class CalculateGradeUseCase implements IUseCase<CalculateGradeUseCaseInpu
     return this.createOrUpdateGrade(studentId, questionListId, normalizedScore);
   }
 
-  /**
-   * Gets the best score from an array of submissions
-   */
-  private getBestScore(submissions: any[]): number {
-    if (!submissions || submissions.length === 0) return 0;
-    return Math.max(...submissions.map(s => s.score || 0));
-  }
-
   /**
    * Creates or updates grade in database
    */
@@ -22,6 +22,8 @@ export interface UpdateListScoringInput {
   };
 }
 
+const GRADE_RECALC_CONCURRENCY = 4;
+
 @injectable()
 export class UpdateListScoringUseCase implements IUseCase<UpdateListScoringInput, QuestionListResponseDTO> {
   constructor(
@@ -60,16 +62,21 @@ export class UpdateListScoringUseCase implements IUseCase<UpdateListScoringInput
     try {
       const grades = await this.gradeRepository.findByList(questionListId);
 
-      for (const grade of grades) {
-        try {
-          await this.gradeService.recalculateAndUpsertGrade(grade.studentId, questionListId);
-        } catch (gradeError) {
-          logger.error('Error recalculating individual grade', {
-            questionListId,
-            studentId: grade.studentId,
-            error: gradeError instanceof Error ? gradeError.message : 'Unknown error'
-          });
-        }
+      // Recalculate in small concurrent batches: each grade is independent I/O,
+      // and the batch size stays well below the database connection pool
+      for (let i = 0; i < grades.length; i += GRADE_RECALC_CONCURRENCY) {
+        const batch = grades.slice(i, i + GRADE_RECALC_CONCURRENCY);
+        await Promise.all(batch.map(async (grade) => {
+          try {
+            await this.gradeService.recalculateAndUpsertGrade(grade.studentId, questionListId);
+          } catch (gradeError) {
+            logger.error('Error recalculating individual grade', {
+              questionListId,
+              studentId: grade.studentId,
+              error: gradeError instanceof Error ? gradeError.message : 'Unknown error'
+            });
+          }
+        }));
       }
 
       logger.info('Grades recalculated after configuration update', {
@@ -1,29 +1,51 @@
 import { injectable, inject } from 'tsyringe';
 import { IUseCase } from '../interfaces/IUseCase';
-import { QuestionResponseDTO } from '../../dtos';
+import { PaginatedQuestionResponseDTO } from '../../dtos';
 import { QuestionRepository } from '../../repositories';
 import { QuestionMapper } from '../../mappers';
 
+export interface GetAllQuestionsFilters {
+  source?: string;
+  tags?: string[];
+  page?: number;
+  limit?: number;
+  /** Load only the columns needed for listing (no statement, oracle or checker code) */
+  summary?: boolean;
+}
+
 /**
  * Use Case: Get all questions
  * 
  * Responsibilities:
- * - Find all available questions
- * - Include basic relationships
+ * - Find available questions, optionally filtered by source/tags
+ * - Apply pagination in the database when a limit is given
  * - Convert to DTOs
- * - Can be extended with filters/pagination in the future
+ * - Return with pagination metadata
  */
 @injectable()
-export class GetAllQuestionsUseCase implements IUseCase<void, QuestionResponseDTO[]> {
+export class GetAllQuestionsUseCase implements IUseCase<GetAllQuestionsFilters, PaginatedQuestionResponseDTO> {
   constructor(
     @inject(QuestionRepository) private questionRepository: QuestionRepository
   ) {}
 
-  async execute(): Promise<QuestionResponseDTO[]> {
-    // 1. Find all questions
-    const questions = await this.questionRepository.findAll();
+  async execute(filters: GetAllQuestionsFilters = {}): Promise<PaginatedQuestionResponseDTO> {
+    // 1. Find questions (filters and pagination are applied by the query)
+    const { questions, total } = await this.questionRepository.findByFilters(filters);
+
+    // 2. Calculate pagination (a single page holds everything when no limit is given)
+    const page = filters.limit !== undefined ? filters.page || 1 : 1;
+    const limit = filters.limit !== undefined ? filters.limit : total;
+    const totalPages = limit > 0 ? Math.ceil(total / limit) : 1;
 
-    // 2. Convert to DTOs
-    return questions.map(question => QuestionMapper.toDTO(question));
+    // 3. Convert to DTOs
+    return {
+      questions: questions.map(question => QuestionMapper.toDTO(question)),
+      pagination: {
+        page,
+        limit,
+        total,
+        totalPages
+      }
+    };
   }
 }
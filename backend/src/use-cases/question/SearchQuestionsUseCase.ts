@@ -6,6 +6,8 @@ import { QuestionMapper } from '../../mappers';
 
 interface SearchQuestionsInput {
   searchTerm: string;
+  source?: string;
+  tags?: string[];
   page?: number;
   limit?: number;
 }
@@ -22,6 +24,7 @@ interface SearchQuestionsOutput {
  * 
  * Responsibilities:
  * - Search questions by title, source, or tags
+ * - Narrow results by exact source/tags filters
  * - Support pagination
  * - Convert to DTOs
  */
@@ -40,7 +43,8 @@ export class SearchQuestionsUseCase implements IUseCase<SearchQuestionsInput, Se
     const [questions, total] = await this.questionRepository.searchGlobal(
       input.searchTerm,
       skip,
-      limit
+      limit,
+      { source: input.source, tags: input.tags }
     );
 
     // 2. Convert to DTOs
@@ -39,25 +39,29 @@ export class BulkUpdateTestCasesUseCase implements IUseCase<BulkUpdateTestCasesU
 
     // 2. Buscar casos de teste existentes
     const existingTestCases = await this.testCaseRepository.findByQuestion(questionId);
-    const existingIds = new Set(existingTestCases.map(tc => tc.id));
+    const existingById = new Map(existingTestCases.map(tc => [tc.id, tc]));
 
     // 3. Separar novos e existentes
     const testCasesToCreate: TestCase[] = [];
     const testCasesToUpdate: TestCase[] = [];
+    const testCasesToKeep: TestCase[] = [];
     const submittedIds = new Set<string>();
 
     for (const tcDto of dto.testCases) {
-      if (tcDto.id && existingIds.has(tcDto.id)) {
-        // Atualizar existente
-        const existing = existingTestCases.find(tc => tc.id === tcDto.id);
-        if (existing) {
+      const existing = tcDto.id ? existingById.get(tcDto.id) : undefined;
+      if (existing) {
+        // Atualizar existente (somente se algum campo mudou)
+        const isHidden = tcDto.isHidden ?? false;
+        if (existing.input !== tcDto.input || existing.expectedOutput !== tcDto.expectedOutput
+          || existing.weight !== tcDto.weight || existing.isHidden !== isHidden) {
           existing.input = tcDto.input;
           existing.expectedOutput = tcDto.expectedOutput;
           existing.weight = tcDto.weight;
-          existing.isHidden = tcDto.isHidden ?? false;
+          existing.isHidden = isHidden;
           testCasesToUpdate.push(existing);
-          submittedIds.add(tcDto.id);
         }
+        testCasesToKeep.push(existing);
+        submittedIds.add(existing.id);
       } else {
         // Criar novo
         const newTestCase = new TestCase();
@@ -80,30 +84,14 @@ export class BulkUpdateTestCasesUseCase implements IUseCase<BulkUpdateTestCasesU
       toDelete: testCasesToDelete.length
     });
 
-    // 5. Executar operações
-    const results: TestCase[] = [];
-
-    // Criar novos
-    for (const tc of testCasesToCreate) {
-      const created = await this.testCaseRepository.create(tc);
-      results.push(created);
-    }
-
-    // Atualizar existentes
-    for (const tc of testCasesToUpdate) {
-      await this.testCaseRepository.update(tc.id, {
-        input: tc.input,
-        expectedOutput: tc.expectedOutput,
-        weight: tc.weight,
-        isHidden: tc.isHidden
-      });
-      results.push(tc);
-    }
-
-    // Deletar não enviados
-    for (const tc of testCasesToDelete) {
-      await this.testCaseRepository.delete(tc.id);
-    }
+    // 5. Executar operações numa única transação: uma falha no meio não deixa a edição pela metade
+    const created = await this.testCaseRepository.applyBulkEdit(
+      testCasesToCreate,
+      testCasesToUpdate,
+      testCasesToDelete.map(tc => tc.id)
+    );
+    // Mesma ordem de findByQuestion: novos casos recebem as últimas posições
+    const results = [...testCasesToKeep, ...created].sort((a, b) => a.position - b.position);
 
     logger.info('[BulkUpdateTestCases] Completed', {
       questionId,
@@ -2,7 +2,7 @@ import { injectable, inject } from 'tsyringe';
 import { TestCaseRepository } from '../../repositories';
 import { GenerateTestCasesOracleDTO, TestCaseResponseDTO } from '../../dtos';
 import { SandboxFusionService } from '../../services/SandboxFusionService';
-import { logger } from '../../utils';
+import { logger, LruCache, hashCacheKey } from '../../utils';
 
 interface GenerateOracleResult {
     createdTestCases: TestCaseResponseDTO[];
@@ -12,6 +12,16 @@ interface GenerateOracleResult {
     }[];
 }
 
+/**
+ * Oracle outputs are deterministic for a given (language, code, input), so successful
+ * executions are memoized to skip executor round-trips when the same oracle is re-run.
+ * Outputs can be several MB, so the cache is also bounded by the total length of the stored outputs.
+ */
+const ORACLE_OUTPUT_CACHE = new LruCache<string, string>(1000, {
+    maxSize: 32 * 1024 * 1024,
+    sizeOf: output => output.length
+});
+
 @injectable()
 export class GenerateTestCasesFromOracleUseCase {
     constructor(
@@ -26,64 +36,124 @@ export class GenerateTestCasesFromOracleUseCase {
             return { createdTestCases: [], failedExecutions: [] };
         }
 
-        const submissions = inputs.map((input: string) => ({
-            sourceCode: oracleCode,
-            language,
-            stdin: input,
-        }));
-
-        logger.info(`Generating ${inputs.length} test cases from oracle for question ${questionId}`);
-
-        const tokens = await this.judgeService.createBatchSubmissions(submissions, {
-            cpuTimeLimit: 5, // give oracle some generous time
-            memoryLimit: 256000 // 256MB
+        const cacheKeys: string[] = inputs.map((input: string) => hashCacheKey(language, oracleCode, input));
+        const outputs: (string | undefined)[] = cacheKeys.map(key => ORACLE_OUTPUT_CACHE.get(key));
+        // Identical inputs (exact string match) are executed once
+        const pendingByInput = new Map<string, number>();
+        outputs.forEach((output, index) => {
+            if (output === undefined && !pendingByInput.has(inputs[index])) {
+                pendingByInput.set(inputs[index], index);
+            }
         });
-
-        const results = await this.judgeService.waitForBatchSubmissionsWithCallback(
-            tokens,
-            async () => { },
-            120, // max attempts
-            500 // 500ms interval => 60s timeout
-        );
+        const pendingIndexes = Array.from(pendingByInput.values());
 
         const createdTestCases: TestCaseResponseDTO[] = [];
         const failedExecutions: { input: string; error: string }[] = [];
+        const errors = new Map<number, string>();
 
-        // The order of results matches tokens? Actually waitForBatchSubmissionsWithCallback preserves token order.
-        // Let's verify results matches the submissions order. It should, but we can map back if needed.
-        // Wait, getBatchSubmissionStatus normally maps the array directly. Let's assume order is preserved.
-        for (let i = 0; i < results.length; i++) {
-            const status = results[i];
-            const input = inputs[i];
+        if (pendingIndexes.length > 0) {
+            // Fail fast: if the oracle does not compile, every execution would fail the same way.
+            // When the check itself is unavailable, fall through and let the executions report their errors
+            const syntaxCheck = await this.judgeService.checkSyntax(oracleCode, language);
+            if (syntaxCheck.unavailable) {
+                logger.warn(`Syntax check skipped for question ${questionId}: ${syntaxCheck.errorMessage}`);
+            } else if (!syntaxCheck.success) {
+                logger.warn(`Oracle code failed syntax check for question ${questionId}`);
+                return {
+                    createdTestCases: [],
+                    failedExecutions: inputs.map((input: string) => ({
+                        input,
+                        error: syntaxCheck.errorMessage || 'Compilation Error'
+                    }))
+                };
+            }
 
-            const processed = this.judgeService.processSubmissionResult(status);
+            const submissions = pendingIndexes.map(index => ({
+                sourceCode: oracleCode,
+                language,
+                stdin: inputs[index],
+            }));
 
-            if (processed.passed) {
-                // Create testcase
-                const created = await this.testCaseRepository.create({
+            logger.info(`Generating ${inputs.length} test cases from oracle for question ${questionId}`, {
+                executions: pendingIndexes.length
+            });
+
+            const tokens = await this.judgeService.createBatchSubmissions(submissions, {
+                cpuTimeLimit: 5, // give oracle some generous time
+                memoryLimit: 256000 // 256MB
+            });
+
+            // waitForBatchSubmissionsWithCallback preserves token order, so results line up with pendingIndexes
+            const results = await this.judgeService.waitForBatchSubmissionsWithCallback(
+                tokens,
+                async () => { },
+                120, // max attempts
+                500 // 500ms interval => 60s timeout
+            );
+
+            for (let i = 0; i < results.length; i++) {
+                const index = pendingIndexes[i];
+                const processed = this.judgeService.processSubmissionResult(results[i]);
+
+                if (processed.passed) {
+                    outputs[index] = processed.output || '';
+                    ORACLE_OUTPUT_CACHE.set(cacheKeys[index], outputs[index]!);
+                } else {
+                    errors.set(index, processed.errorMessage || 'Unknown error (Execution Failed)');
+                }
+            }
+
+            // Fan results out to the duplicates of each executed input
+            inputs.forEach((input: string, index: number) => {
+                if (outputs[index] !== undefined || errors.has(index)) return;
+                const source = pendingByInput.get(input);
+                if (source === undefined) return;
+                if (outputs[source] !== undefined) {
+                    outputs[index] = outputs[source];
+                } else if (errors.has(source)) {
+                    errors.set(index, errors.get(source)!);
+                }
+            });
+        } else {
+            logger.info(`All ${inputs.length} oracle outputs for question ${questionId} served from cache`);
+        }
+
+        const rows: { questionId: string; input: string; expectedOutput: string; weight: number; isHidden: boolean }[] = [];
+        for (let i = 0; i < inputs.length; i++) {
+            const input = inputs[i];
+            const expectedOutput = outputs[i];
+
+            if (expectedOutput !== undefined) {
+                rows.push({
                     questionId,
                     input,
-                    expectedOutput: processed.output || '',
+                    expectedOutput,
                     weight: defaultWeight,
                     isHidden: defaultIsHidden
                 });
+            } else {
+                failedExecutions.push({
+                    input,
+                    error: errors.get(i) || 'Unknown error (Execution Failed)'
+                });
+            }
+        }
 
+        // All test cases are inserted in a single batch instead of one round-trip per input
+        if (rows.length > 0) {
+            const created = await this.testCaseRepository.bulkCreate(rows);
+            for (const testCase of created) {
                 createdTestCases.push(
                     new TestCaseResponseDTO({
-                        id: created.id,
-                        questionId: created.questionId,
-                        input: created.input,
-                        expectedOutput: created.expectedOutput,
-                        weight: created.weight,
-                        isHidden: created.isHidden,
-                        createdAt: created.createdAt
+                        id: testCase.id,
+                        questionId: testCase.questionId,
+                        input: testCase.input,
+                        expectedOutput: testCase.expectedOutput,
+                        weight: testCase.weight,
+                        isHidden: testCase.isHidden,
+                        createdAt: testCase.createdAt
                     })
                 );
-            } else {
-                failedExecutions.push({
-                    input,
-                    error: processed.errorMessage || 'Unknown error (Execution Failed)'
-                });
             }
         }
 
@@ -63,31 +63,32 @@ export class ImportTestCasesFromFileUseCase {
             errors: [],
         };
 
+        // Validate first, then insert all valid rows in a single batch
+        const validRows: { index: number; data: { questionId: string; input: string; expectedOutput: string; weight: number } }[] = [];
+
         for (let i = 0; i < testCases.length; i++) {
-            try {
-                const tc = testCases[i];
-
-                // Validate
-                if (!tc.input || !tc.output) {
-                    result.failed++;
-                    result.errors.push(`Test case ${i + 1}: Missing input or output`);
-                    continue;
-                }
+            const tc = testCases[i];
+
+            if (!tc.input || !tc.output) {
+                result.failed++;
+                result.errors.push(`Test case ${i + 1}: Missing input or output`);
+                continue;
+            }
 
-                // Create test case with default weight of 10
-                await this.testCaseRepository.create({
+            // Default weight of 10
+            validRows.push({
+                index: i,
+                data: {
                     questionId,
                     input: tc.input.toString(),
                     expectedOutput: tc.output.toString(),
                     weight: 10,
-                });
+                }
+            });
+        }
 
-                result.imported++;
-            } catch (error: any) {
-                result.failed++;
-                result.errors.push(`Test case ${i + 1}: ${error.message}`);
-                logger.error(`Error importing test case ${i + 1}:`, error);
-            }
+        if (validRows.length > 0) {
+            await this.insertRows(validRows, result);
         }
 
         logger.info(`Import completed: ${result.imported} imported, ${result.failed} failed`);
@@ -95,6 +96,33 @@ export class ImportTestCasesFromFileUseCase {
         return result;
     }
 
+    /**
+     * Inserts rows as one batch. If the batch fails, it is split in halves and retried so a
+     * single bad row doesn't reject the whole file, without falling back to one insert per row.
+     * Halves are retried in order, so the inserted rows keep the file order.
+     */
+    private async insertRows(
+        rows: { index: number; data: { questionId: string; input: string; expectedOutput: string; weight: number } }[],
+        result: ImportResult
+    ): Promise<void> {
+        try {
+            await this.testCaseRepository.bulkCreate(rows.map(row => row.data));
+            result.imported += rows.length;
+        } catch (error: any) {
+            if (rows.length === 1) {
+                result.failed++;
+                result.errors.push(`Test case ${rows[0].index + 1}: ${error.message}`);
+                logger.error(`Error importing test case ${rows[0].index + 1}:`, error);
+                return;
+            }
+
+            logger.warn(`Batch import of ${rows.length} rows failed, retrying in halves: ${error.message}`);
+            const middle = Math.ceil(rows.length / 2);
+            await this.insertRows(rows.slice(0, middle), result);
+            await this.insertRows(rows.slice(middle), result);
+        }
+    }
+
     private parseJSON(content: string): TestCaseInput[] {
         const data = JSON.parse(content);
 
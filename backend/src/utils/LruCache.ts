@@ -0,0 +1,71 @@
+/**
+ * @module utils/LruCache
+ * @description Small in-process LRU cache for deterministic, recomputable results.
+ * Relies on Map insertion order: reads move an entry to the end, and the first entry is evicted when full.
+ */
+
+export interface LruCacheSizeOptions<V> {
+  /** Upper bound on the summed size of all values, in the unit returned by sizeOf */
+  maxSize: number;
+  sizeOf: (value: V) => number;
+}
+
+export class LruCache<K, V> {
+  private entries = new Map<K, V>();
+  private totalSize = 0;
+
+  constructor(
+    private readonly maxEntries: number,
+    private readonly sizeOptions?: LruCacheSizeOptions<V>
+  ) { }
+
+  get(key: K): V | undefined {
+    const value = this.entries.get(key);
+    if (value !== undefined) {
+      this.entries.delete(key);
+      this.entries.set(key, value);
+    }
+    return value;
+  }
+
+  /**
+   * Stores a value, evicting the oldest entries until both limits hold.
+   * Values larger than maxSize on their own are not cached.
+   */
+  set(key: K, value: V): void {
+    this.delete(key);
+
+    const valueSize = this.sizeOptions ? this.sizeOptions.sizeOf(value) : 0;
+    if (this.sizeOptions && valueSize > this.sizeOptions.maxSize) {
+      return;
+    }
+
+    while (
+      this.entries.size > 0 && (
+        this.entries.size >= this.maxEntries ||
+        (this.sizeOptions !== undefined && this.totalSize + valueSize > this.sizeOptions.maxSize)
+      )
+    ) {
+      const oldestKey = this.entries.keys().next().value as K;
+      this.delete(oldestKey);
+    }
+
+    this.entries.set(key, value);
+    this.totalSize += valueSize;
+  }
+
+  get size(): number {
+    return this.entries.size;
+  }
+
+  private delete(key: K): void {
+    const value = this.entries.get(key);
+    if (value === undefined) {
+      return;
+    }
+    this.entries.delete(key);
+    if (this.sizeOptions) {
+      this.totalSize -= this.sizeOptions.sizeOf(value);
+    }
+  }
+}
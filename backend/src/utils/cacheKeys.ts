@@ -0,0 +1,17 @@
+/**
+ * @module utils/cacheKeys
+ * @description Helpers to build cache keys for source code and test inputs.
+ */
+import * as crypto from 'crypto';
+
+/**
+ * SHA-256 of the parts encoded as a JSON array, so a separator inside a part cannot make two
+ * different part lists collide. Parts are hashed exactly as given: whitespace in code and stdin
+ * can change what a program prints, so near-duplicates must not share an entry.
+ */
+export function hashCacheKey(...parts: string[]): string {
+  return crypto
+    .createHash('sha256')
+    .update(JSON.stringify(parts))
+    .digest('hex');
+}
@@ -9,6 +9,7 @@
  * - Custom error classes with proper HTTP status codes
  * - Data sanitization to prevent sensitive info leaks
  * - Async handler wrapper for Express route handlers
+ * - In-process LRU cache and cache key helpers for deterministic results
  * 
  * @module utils
  */
@@ -33,4 +34,5 @@ export {
 export { sanitizeForLog, sanitizeUserForLog, sanitizeHeaders } from './sanitize';
 export { asyncHandler } from './asyncHandler';
 export { ConstraintParser, ParsedConstraints, VariableConstraint } from './ConstraintParser';
-
+export { LruCache } from './LruCache';
+export { hashCacheKey } from './cacheKeys';
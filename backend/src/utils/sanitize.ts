@@ -32,6 +32,11 @@ const SENSITIVE_FIELDS = [
   'ssn'
 ];
 
+/**
+ * Lowercased once at module load, so each key check only lowercases the key itself
+ */
+const SENSITIVE_FIELDS_LOWER = SENSITIVE_FIELDS.map(field => field.toLowerCase());
+
 /**
  * Sanitize For Log
  * 
@@ -75,8 +80,8 @@ export function sanitizeForLog(obj: any, replacement: string = '[REDACTED]'): an
     if (obj.hasOwnProperty(key)) {
       const lowerKey = key.toLowerCase();
 
-      const isSensitive = SENSITIVE_FIELDS.some(field => 
-        lowerKey.includes(field.toLowerCase())
+      const isSensitive = SENSITIVE_FIELDS_LOWER.some(field =>
+        lowerKey.includes(field)
       );
 
       if (isSensitive) {
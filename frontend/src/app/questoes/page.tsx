@@ -65,6 +65,9 @@ export default function QuestoesPage() {
                 searchParams.append('page', state.currentPage.toString());
                 searchParams.append('limit', state.itemsPerPage.toString());
 
+                if (state.sourceFilter !== "all") searchParams.append('source', state.sourceFilter);
+                if (state.tagFilter.length > 0) searchParams.append('tags', state.tagFilter.join(','));
+
                 const response = await api.get<any>(`/questions/search/global?${searchParams.toString()}`);
                 const { questions = [], total = 0 } = response.data || {};
 
@@ -50,7 +50,8 @@ export default function SelectQuestionModal({
     const loadQuestions = async () => {
         try {
             setLoading(true);
-            const response = await api.get<any>("/questions");
+            // Apenas os campos exibidos no seletor; enunciado e códigos não são necessários aqui
+            const response = await api.get<any>("/questions?fields=summary");
             setQuestions(response.data?.questions || []);
         } catch (error: any) {
             toast({
@@ -67,10 +68,12 @@ export default function SelectQuestionModal({
     const allSources = Array.from(new Set(questions.map(q => q.source).filter(Boolean))) as string[];
     const allTags = Array.from(new Set(questions.flatMap(q => q.tags || [])));
 
-    // Filtrar questões
+    // Filtrar questões (termo normalizado uma única vez, não por questão)
+    const searchLower = searchTerm.toLowerCase();
     let filteredQuestions = questions.filter(q => {
-        const matchesSearch = q.title.toLowerCase().includes(searchTerm.toLowerCase()) ||
-            (q.source?.toLowerCase().includes(searchTerm.toLowerCase()) ?? false);
+        const matchesSearch = !searchLower ||
+            q.title.toLowerCase().includes(searchLower) ||
+            (q.source?.toLowerCase().includes(searchLower) ?? false);
 
         const matchesSource = !sourceFilter || q.source === sourceFilter;
 
@@ -4,8 +4,12 @@ import { useState } from "react";
 import CodeEditor from "./../ui/CodeEditor";
 import { generateTestCasesOracle } from "@/services/testCases";
 import { logger } from "@/utils/logger";
+import { countLines } from "@/utils";
 import JSZip from "jszip";
 
+// Files inside an uploaded zip that are treated as test inputs
+const INPUT_FILE_PATTERN = /\.(txt|in)$/i;
+
 interface GenerateTestCasesModalProps {
   isOpen: boolean;
   onClose: () => void;
@@ -62,20 +66,17 @@ export default function GenerateTestCasesModal({
     try {
       const zip = new JSZip();
       const contents = await zip.loadAsync(file);
-      const newInputsFromZip: string[] = [];
 
       // Sort files alphabetically to maintain some order
-      const fileNames = Object.keys(contents.files).sort();
+      const fileNames = Object.keys(contents.files)
+        .sort()
+        .filter(filename => !contents.files[filename].dir && INPUT_FILE_PATTERN.test(filename));
 
-      for (const filename of fileNames) {
-        const zipFile = contents.files[filename];
-        if (!zipFile.dir && (filename.toLowerCase().endsWith('.txt') || filename.toLowerCase().endsWith('.in'))) {
-          const text = await zipFile.async("string");
-          if (text.trim()) {
-            newInputsFromZip.push(text.trim());
-          }
-        }
-      }
+      // Entries are decompressed concurrently; Promise.all keeps the sorted order
+      const texts = await Promise.all(fileNames.map(filename => contents.files[filename].async("string")));
+      const newInputsFromZip = texts
+        .map(text => text.trim())
+        .filter(text => text !== "");
 
       if (newInputsFromZip.length === 0) {
         setError("Nenhum arquivo .txt ou .in válido foi encontrado no zip.");
@@ -100,7 +101,7 @@ export default function GenerateTestCasesModal({
     }
   };
 
-  const currentLineCount = oracleCode.split("\n").length;
+  const currentLineCount = countLines(oracleCode);
   // Make editor grow dynamically with a min/max limit
   const editorHeight = Math.min(Math.max(150, currentLineCount * 24 + 40), 400);
 
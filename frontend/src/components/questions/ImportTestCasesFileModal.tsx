@@ -16,6 +16,10 @@ interface TestCasePreview {
   output: string;
 }
 
+// CSV line tokens: a quoted segment (quotes dropped, may be unterminated), a run of plain characters, or a separator.
+// Scanning whole runs avoids walking the line one character at a time.
+const CSV_TOKEN_REGEX = /"([^"]*)"?|([^,"]+)|,/g;
+
 export default function ImportTestCasesFileModal({
   isOpen,
   onClose,
@@ -128,21 +132,18 @@ export default function ImportTestCasesFileModal({
   const parseCSVLine = (line: string): string[] => {
     const result: string[] = [];
     let current = '';
-    let inQuotes = false;
-
-    for (let i = 0; i < line.length; i++) {
-      const char = line[i];
-      
-      if (char === '"') {
-        inQuotes = !inQuotes;
-      } else if (char === ',' && !inQuotes) {
+    let match: RegExpExecArray | null;
+
+    CSV_TOKEN_REGEX.lastIndex = 0;
+    while ((match = CSV_TOKEN_REGEX.exec(line)) !== null) {
+      if (match[0] === ',') {
         result.push(current.trim());
         current = '';
       } else {
-        current += char;
+        current += match[1] ?? match[2];
       }
     }
-    
+
     result.push(current.trim());
     return result;
   };
@@ -238,6 +238,40 @@ export default function TestCasesModal({
 
   if (!isOpen) return null;
 
+  const emptyTestCase: TestCase = {
+    id: "new-1",
+    input: "",
+    expectedOutput: "",
+    weight: 10,
+    isHidden: false,
+  };
+
+  // Recarrega os casos de teste do servidor após uma operação em lote.
+  // Com resetWhenEmpty, uma lista vazia é substituída por um caso em branco.
+  const reloadTestCases = async (resetWhenEmpty: boolean) => {
+    hasLoadedRef.current = null;
+    setIsLoading(true);
+    try {
+      const cases = await testCasesService.getTestCases(questionId);
+      if (Array.isArray(cases) && cases.length > 0) {
+        setTestCases(cases.map((tc, index) => ({
+          id: tc.id,
+          input: tc.input || '',
+          expectedOutput: tc.expectedOutput || '',
+          weight: tc.weight || 10,
+          isHidden: tc.isHidden || false,
+          order: index,
+        })));
+      } else if (resetWhenEmpty) {
+        setTestCases([emptyTestCase]);
+      }
+      hasLoadedRef.current = questionId;
+    } catch (loadError: any) {
+    } finally {
+      setIsLoading(false);
+    }
+  };
+
   const addTestCase = () => {
     const newTestCase: TestCase = {
       id: `new-${Date.now()}`,
@@ -344,36 +378,7 @@ export default function TestCasesModal({
         setError(`Alguns casos de teste não puderam ser removidos (${succeeded.length}/${savedCases.length} removidos). Tente novamente.`);
       }
 
-      hasLoadedRef.current = null;
-      setIsLoading(true);
-      try {
-        const cases = await testCasesService.getTestCases(questionId);
-        if (Array.isArray(cases) && cases.length > 0) {
-          const mappedCases = cases.map((tc, index) => ({
-            id: tc.id,
-            input: tc.input || '',
-            expectedOutput: tc.expectedOutput || '',
-            weight: tc.weight || 10,
-            isHidden: tc.isHidden || false,
-            order: index,
-          }));
-          setTestCases(mappedCases);
-        } else {
-          setTestCases([
-            {
-              id: "new-1",
-              input: "",
-              expectedOutput: "",
-              weight: 10,
-              isHidden: false,
-            },
-          ]);
-        }
-        hasLoadedRef.current = questionId;
-      } catch (loadError: any) {
-      } finally {
-        setIsLoading(false);
-      }
+      await reloadTestCases(true);
 
       setDeleteAllConfirm(false);
 
@@ -386,36 +391,7 @@ export default function TestCasesModal({
     } catch (error: any) {
       setError(error?.message || "Erro ao remover casos de teste. Tente novamente.");
 
-      hasLoadedRef.current = null;
-      setIsLoading(true);
-      try {
-        const cases = await testCasesService.getTestCases(questionId);
-        if (Array.isArray(cases) && cases.length > 0) {
-          const mappedCases = cases.map((tc, index) => ({
-            id: tc.id,
-            input: tc.input || '',
-            expectedOutput: tc.expectedOutput || '',
-            weight: tc.weight || 10,
-            isHidden: tc.isHidden || false,
-            order: index,
-          }));
-          setTestCases(mappedCases);
-        } else {
-          setTestCases([
-            {
-              id: "new-1",
-              input: "",
-              expectedOutput: "",
-              weight: 10,
-              isHidden: false,
-            },
-          ]);
-        }
-        hasLoadedRef.current = questionId;
-      } catch (loadError: any) {
-      } finally {
-        setIsLoading(false);
-      }
+      await reloadTestCases(true);
     } finally {
       setIsDeletingAll(false);
     }
@@ -487,26 +463,7 @@ export default function TestCasesModal({
       }
 
       setSaveSuccess(true);
-      hasLoadedRef.current = null;
-      setIsLoading(true);
-      try {
-        const cases = await testCasesService.getTestCases(questionId);
-        if (Array.isArray(cases) && cases.length > 0) {
-          const mappedCases = cases.map((tc, index) => ({
-            id: tc.id,
-            input: tc.input || '',
-            expectedOutput: tc.expectedOutput || '',
-            weight: tc.weight || 10,
-            isHidden: tc.isHidden || false,
-            order: index,
-          }));
-          setTestCases(mappedCases);
-        }
-        hasLoadedRef.current = questionId;
-      } catch (err: any) {
-      } finally {
-        setIsLoading(false);
-      }
+      await reloadTestCases(false);
 
       addTimeout(() => {
         onClose();
@@ -520,26 +477,7 @@ export default function TestCasesModal({
   };
 
   const handleGenerateSuccess = async () => {
-    hasLoadedRef.current = null;
-    setIsLoading(true);
-    try {
-      const cases = await testCasesService.getTestCases(questionId);
-      if (Array.isArray(cases) && cases.length > 0) {
-        const mappedCases = cases.map((tc, index) => ({
-          id: tc.id,
-          input: tc.input || '',
-          expectedOutput: tc.expectedOutput || '',
-          weight: tc.weight || 10,
-          isHidden: tc.isHidden || false,
-          order: index,
-        }));
-        setTestCases(mappedCases);
-      }
-      hasLoadedRef.current = questionId;
-    } catch (err: any) {
-    } finally {
-      setIsLoading(false);
-    }
+    await reloadTestCases(false);
   };
 
   return (
@@ -40,36 +40,23 @@ export default function TextEditorWithLatex({
       return `\n${placeholder}\n`;
     });
 
-    // Then handle inline formulas with proper line break detection
-    let formulaMatches = [];
-    let match;
-    const formulaRegex = /\$([^\$]+?)\$/g;
-    while ((match = formulaRegex.exec(html)) !== null) {
-      formulaMatches.push({
-        index: match.index,
-        match: match[0],
-        content: match[1]
-      });
-    }
-
-    // Process formulas in reverse order to maintain correct indices
-    for (let i = formulaMatches.length - 1; i >= 0; i--) {
-      const fm = formulaMatches[i];
+    // Then handle inline formulas with proper line break detection.
+    // A single replace pass; the own-line check looks at the surrounding text of the source string.
+    html = html.replace(/\$([^\$]+?)\$/g, (match: string, content: string, offset: number, source: string) => {
       const placeholder = `__FORMULA_${formulaIndex}__`;
-      formulas[placeholder] = fm.content;
+      formulas[placeholder] = content;
       formulaIndex++;
 
       // Check if formula is on its own line
-      const before = html.substring(Math.max(0, fm.index - 100), fm.index);
-      const after = html.substring(fm.index + fm.match.length, Math.min(html.length, fm.index + fm.match.length + 100));
+      const before = source.substring(Math.max(0, offset - 100), offset);
+      const after = source.substring(offset + match.length, Math.min(source.length, offset + match.length + 100));
       const beforeTrimmed = before.trim();
       const afterTrimmed = after.trim();
       const isOnOwnLine = (beforeTrimmed === '' || beforeTrimmed.endsWith('\n')) &&
         (afterTrimmed === '' || afterTrimmed.startsWith('\n'));
 
-      const replacement = isOnOwnLine ? `\n${placeholder}\n` : placeholder;
-      html = html.substring(0, fm.index) + replacement + html.substring(fm.index + fm.match.length);
-    }
+      return isOnOwnLine ? `\n${placeholder}\n` : placeholder;
+    });
 
     html = html.replace(/\*\*([^\*]+)\*\*/g, (match: string, content: string) => `<strong>${content}</strong>`);
     html = html.replace(/\*([^\*]+)\*/g, (match: string, content: string) => `<em>${content}</em>`);
@@ -3,6 +3,7 @@
 import { useState, useRef } from "react";
 import { Prism as SyntaxHighlighter } from "react-syntax-highlighter";
 import { vscDarkPlus } from "react-syntax-highlighter/dist/esm/styles/prism";
+import { countLines } from "@/utils";
 
 interface CodeEditorProps {
     value: string;
@@ -62,7 +63,7 @@ export default function CodeEditor({
     const isPlaceholder = !value;
 
     // Generate line numbers
-    const lineCount = (value || "").split("\n").length;
+    const lineCount = countLines(value || "");
     const lines = Array.from({ length: Math.max(lineCount, 1) }, (_, i) => i + 1);
 
     const fontStyle = {
@@ -32,9 +32,12 @@ export const getTestCases = async (questionId: string): Promise<TestCaseResponse
     } else if (data && typeof data === 'object' && 'testCases' in data) {
       const dataWithTestCases = data as { testCases?: unknown };
       return Array.isArray(dataWithTestCases.testCases) ? dataWithTestCases.testCases : [];
-    } else if (data && typeof data === 'object' && Array.isArray(Object.values(data)[0])) {
-      const firstArray = Object.values(data).find(v => Array.isArray(v)) as TestCaseResponseDTO[] | undefined;
-      return firstArray || [];
+    } else if (data && typeof data === 'object') {
+      // Last-resort fallback: only enumerate the payload values when the known shapes don't match
+      const values = Object.values(data);
+      if (Array.isArray(values[0])) {
+        return values[0] as TestCaseResponseDTO[];
+      }
     }
 
     return [];
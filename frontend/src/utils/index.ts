@@ -8,3 +8,4 @@ export * from './scoringUtils';
 export * from './logger';
 export * from './toastHelpers';
 export * from './languageUtils';
+export * from './textUtils';
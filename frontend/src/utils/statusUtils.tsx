@@ -18,9 +18,7 @@ export function normalizeStatus(status: string): string {
   return STATUS_TRANSLATIONS[status] || status;
 }
 
-export function getSubmissionStatusColor(status: string): string {
-  const normalizedStatus = normalizeStatus(status);
-  
+function classifyStatusColor(normalizedStatus: string): string {
   if (normalizedStatus === 'Aceito' || normalizedStatus === 'Aceita') {
     return 'bg-green-100 text-green-800';
   }
@@ -36,6 +34,18 @@ export function getSubmissionStatusColor(status: string): string {
   return 'bg-gray-100 text-gray-800';
 }
 
+// Cores dos status conhecidos (originais e traduzidos), calculadas uma vez no carregamento do módulo
+const STATUS_COLORS: Record<string, string> = Object.fromEntries(
+  Object.entries(STATUS_TRANSLATIONS).flatMap(([status, translated]) => [
+    [status, classifyStatusColor(translated)],
+    [translated, classifyStatusColor(translated)]
+  ])
+);
+
+export function getSubmissionStatusColor(status: string): string {
+  return STATUS_COLORS[status] ?? classifyStatusColor(normalizeStatus(status));
+}
+
 export function getVerdictColor(verdict: string): string {
   if (verdict === 'Accepted') return 'text-green-600';
   if (verdict.includes('Wrong Answer')) return 'text-orange-600';
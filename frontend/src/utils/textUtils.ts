@@ -0,0 +1,16 @@
+/**
+ * Conta as linhas de um texto sem criar um array com cada linha
+ * (usado a cada tecla digitada nos editores de código)
+ *
+ * @param text - Texto a ser analisado
+ * @returns Número de linhas (um texto vazio tem 1 linha)
+ */
+export function countLines(text: string): number {
+  let count = 1;
+  let index = text.indexOf('\n');
+  while (index !== -1) {
+    count++;
+    index = text.indexOf('\n', index + 1);
+  }
+  return count;
+}